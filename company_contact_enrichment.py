@@ -6,19 +6,33 @@ Pauses for manual CAPTCHA solve when detected.
 """
 
 import argparse
+import asyncio
 import csv
+import hashlib
 import json
 import logging
 import random
 import re
+import socket
+import sqlite3
 import sys
+import textwrap
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any
-from urllib.parse import urljoin, urlparse
+from typing import Any, Iterable, Iterator, TextIO
+from urllib.parse import unquote_to_bytes, urljoin, urlparse
 
-from playwright.sync_api import Page, Route, sync_playwright, TimeoutError as PlaywrightTimeout
+try:
+    import re2  # google-re2: linear-time DFA for the patterns scanned over whole pages
+except ImportError:
+    re2 = re
+
+import ahocorasick
+import phonenumbers
+import requests
+from selectolax.lexbor import LexborHTMLParser
+from playwright.async_api import Browser, Page, Route, async_playwright, TimeoutError as PlaywrightTimeout
 
 # ============ Logging ============
 
@@ -36,33 +50,121 @@ logger = logging.getLogger(__name__)
 
 # Track CAPTCHA encounters for reporting
 CAPTCHA_ENCOUNTERS: list[dict[str, str]] = []
+# Only one manual CAPTCHA prompt at a time across concurrent companies
+CAPTCHA_LOCK = asyncio.Lock()
 
 # ============ Configuration ============
 
-EXCLUDED_DOMAINS = {
+# Matched label-exact against a host and its parent domains (see is_excluded_host), not as substrings
+EXCLUDED_DOMAINS = frozenset({
     "linkedin.com", "facebook.com", "fb.com", "twitter.com", "x.com",
     "crunchbase.com", "wikipedia.org", "wikimedia.org", "youtube.com",
     "instagram.com", "pinterest.com", "reddit.com", "medium.com",
     "bloomberg.com", "reuters.com", "bbc.com", "cnn.com", "nytimes.com",
     "theguardian.com", "forbes.com", "techcrunch.com", "businesswire.com",
     "prnewswire.com", "zoominfo.com", "duckduckgo.com", "google.com",
-}
-
-EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.I)
-PHONE_PATTERN = re.compile(
-    r"(?:\+?\d{1,4}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{3,4}(?:[-.\s]?\d{2,4})?",
-    re.MULTILINE,
+})
+
+# Hot patterns (run over full page HTML) use RE2 when available; no flags, RE2 takes options instead
+EMAIL_PATTERN = re2.compile(r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b")
+# Single-pass classifier over raw page HTML bytes: one scan yields social links and candidate
+# URLs (emails come from visible text, see extract_emails). Bytes in, bytes out, so RE2 skips the
+# str->UTF-8 copy and offset mapping it does for every str search. Social branches precede the
+# generic URL branch so alternation picks the specific bucket; groups are unnamed and map onto
+# CONTACT_KINDS by index. A match swallows anything nested in it (a LinkedIn link inside
+# google.com/url?q=), so extract_contacts rescans each matched URL's decoded query.
+CONTACT_KINDS = ("linkedin", "twitter", "facebook", "urls")
+CONTACTS_RE = re2.compile(
+    rb"((?i:https?://(?:www\.)?linkedin\.com/)[^\s\"'<>]+)"
+    rb"|((?i:https?://(?:www\.)?(?:twitter\.com|x\.com)/)[^\s\"'<>]+)"
+    rb"|((?i:https?://(?:www\.)?(?:facebook|fb)\.com/)[^\s\"'<>]+)"
+    rb"|(https?://(?:www\.)?[a-zA-Z0-9][-a-zA-Z0-9]*\.(?:com|org|net|io|co|in)/[^\s\"'<>]*)"
 )
-PHONE_STRICT = re.compile(r"\+\d{1,4}[-.\s]?\d{2,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}(?:[-.\s]?\d{2,4})?")
-LINKEDIN_P = re.compile(r"https?://(?:www\.)?linkedin\.com/[^\s\"'<>]+", re.I)
-TWITTER_P = re.compile(r"https?://(?:www\.)?(?:twitter\.com|x\.com)/[^\s\"'<>]+", re.I)
-FACEBOOK_P = re.compile(r"https?://(?:www\.)?(?:facebook|fb)\.com/[^\s\"'<>]+", re.I)
+EMAIL_SKIP = ("example.com", "test.com", "duckduckgo.com", "google.com", "wixpress.com")
+
+# Tags whose contents are never visible text (and were the main source of junk emails/phones)
+NON_TEXT_TAGS = ["script", "style", "noscript"]
+NON_SLUG_RE = re.compile(r"[^a-z0-9]")
+ADDR_ZIP_RE = re.compile(r"\d{4,6}")
+ADDR_STREET_WORDS = ("street", "st", "road", "rd", "avenue", "ave", "floor", "fl")
+ADDR_HINT_WORDS = ("headquartered", "located", "address")
+CONSENT_BUTTON_RES = tuple(
+    re.compile(re.escape(t), re.I) for t in ("Accept all", "I agree", "Accept", "Agree", "Accept All")
+)
+
+# Link reads are done in one page-side evaluate instead of a CDP round-trip per element
+HREFS_JS = "els => els.map(e => e.href)"
+LINKS_JS = "els => els.map(e => [e.href, (e.innerText || '').toLowerCase()])"
 
 CONTACT_PATHS = ("/contact", "/contact-us", "/about", "/about-us", "/get-in-touch", "/reach-us", "/support")
 CONTACT_LINK_HINTS = ["contact", "contact us", "about", "about us", "reach us", "get in touch", "support"]
 
-DELAY_MIN, DELAY_MAX = 2.0, 5.0
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+def build_automaton(words: Iterable[tuple[str, Any]]) -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over (word, tag) pairs; each match yields (end_index, (len(word), tag))."""
+    automaton = ahocorasick.Automaton()
+    for word, tag in words:
+        automaton.add_word(word, (len(word), tag))
+    automaton.make_automaton()
+    return automaton
+
+
+# Keyword lookups scan each short line once in C instead of one regex/substring test per keyword.
+# Street words are tagged True: they only count as whole words ("st" must not hit "first").
+ADDR_AUTOMATON = build_automaton([*((w, True) for w in ADDR_STREET_WORDS), *((w, False) for w in ADDR_HINT_WORDS)])
+CONTACT_HINT_AUTOMATON = build_automaton((h, h) for h in CONTACT_LINK_HINTS)
+
+# Resource blocking: we only read DOM text, so anything that doesn't affect it is aborted
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet", "websocket", "other"})
+TRACKER_HOSTS = (
+    "doubleclick.net", "google-analytics.com", "googletagmanager.com", "facebook.net",
+    "hotjar.com", "segment.io", "cloudflareinsights.com",
+)
+# Google's own CSS is kept so the SERP/knowledge panel render as usual for inner_text
+KEEP_STYLE_HOSTS = ("google.com", "gstatic.com")
+
+DELAY_MIN, DELAY_MAX = 2.0, 5.0  # anti-bot pause, only between Google submit and reading results
+SEARCH_BOX = 'textarea[name="q"], input[name="q"]'
+SERP_SELECTOR = "#search, #rso"
+DEFAULT_CONCURRENCY = 4
+
+# Domain guessing: try <slug>.<tld> directly before falling back to a Google search
+GUESS_TLDS = ("com", "io", "co")
+COUNTRY_TLDS = {
+    "india": "in", "united kingdom": "co.uk", "uk": "co.uk", "germany": "de", "france": "fr",
+    "united arab emirates": "ae", "uae": "ae", "lithuania": "lt", "netherlands": "nl", "spain": "es",
+    "italy": "it", "singapore": "sg", "australia": "com.au", "canada": "ca", "japan": "jp",
+    "saudi arabia": "sa", "switzerland": "ch", "sweden": "se", "poland": "pl", "israel": "co.il",
+}
+# A guessed homepage redirecting, or whose head contains one of these, is a parked/for-sale domain
+PARKED_MARKERS = (
+    "domain is for sale", "domain may be for sale", "buy this domain", "domain for sale", "parked free",
+    "parkingcrew", "sedoparking", "sedo.com", "hugedomains", "afternic", "dan.com", "bodis.com",
+)
+# Region hint for phonenumbers, so national-format numbers ("080 4567 8901") parse without +CC
+COUNTRY_REGIONS = {
+    "india": "IN", "united kingdom": "GB", "uk": "GB", "germany": "DE", "france": "FR",
+    "united arab emirates": "AE", "uae": "AE", "lithuania": "LT", "netherlands": "NL", "spain": "ES",
+    "italy": "IT", "singapore": "SG", "australia": "AU", "canada": "CA", "japan": "JP",
+    "saudi arabia": "SA", "switzerland": "CH", "sweden": "SE", "poland": "PL", "israel": "IL",
+    "united states": "US", "usa": "US",
+}
+TITLE_READ_BYTES = 65536  # guessed homepages are read this far for <title> and parked-domain markers
+TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+
+# pick_best_website stops at the first URL scoring at least this (e.g. knowledge-panel homepage)
+EARLY_ACCEPT_CONFIDENCE = 0.75
+
+CACHE_FILE = Path(__file__).parent / "enrichment_cache.sqlite"
+CACHE_TTL = 30 * 24 * 3600  # seconds; older entries are re-enriched
+# Rotated per company context so consecutive searches don't share one fingerprint
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+LOCALES = ("en-IN", "en-US", "en-GB")
 
 
 # ============ Data Models ============
@@ -102,61 +204,142 @@ class CompanyResult:
         }
 
 
+CSV_FIELDS = [f.name for f in fields(CompanyResult)]
+
+
+# ============ Result Cache ============
+
+def cache_key(company: CompanyInput) -> str:
+    """
+    Readable slug of name and country, plus a hash of the whitespace-normalized originals:
+    the slugs alone collide ("Tech India"/"" vs "Tech"/"India") and are empty for non-Latin names.
+    """
+    name = " ".join(company.company_name.lower().split())
+    country = " ".join(company.country.lower().split())
+    digest = hashlib.sha1(f"{name}\0{country}".encode()).hexdigest()[:16]
+    return f"{NON_SLUG_RE.sub('', name)}:{NON_SLUG_RE.sub('', country)}:{digest}"
+
+
+class ResultCache:
+    """SQLite store of finished CompanyResults keyed by normalized (company_name, country)."""
+
+    def __init__(self, path: Path = CACHE_FILE, ttl: int = CACHE_TTL) -> None:
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts INTEGER, payload TEXT)")
+
+    def get(self, company: CompanyInput) -> CompanyResult | None:
+        row = self.conn.execute(
+            "SELECT payload FROM cache WHERE key = ? AND ts > ?",
+            (cache_key(company), int(time.time()) - self.ttl),
+        ).fetchone()
+        return CompanyResult(**json.loads(row[0])) if row else None
+
+    def put(self, company: CompanyInput, result: CompanyResult) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cache (key, ts, payload) VALUES (?, ?, ?)",
+            (cache_key(company), int(time.time()), json.dumps(result.to_dict(), ensure_ascii=False)),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
 # ============ Extraction Helpers ============
 
-def strip_html(text: str) -> str:
+def strip_html(text: str, separator: str = " ") -> str:
+    """Visible text of an HTML document (entities decoded, script/style bodies dropped); separator goes between text nodes."""
     if not text:
         return ""
-    return re.sub(r"<[^>]+>", " ", text).replace("&nbsp;", " ").replace("&amp;", "&")
+    tree = LexborHTMLParser(text)
+    tree.strip_tags(NON_TEXT_TAGS)
+    # &nbsp; decodes to U+00A0, which RE2's ASCII \s would not treat as a separator
+    return tree.text(separator=separator).replace("\xa0", " ")
+
+
+def clean_emails(found: Iterable[str]) -> list[str]:
+    """Lowercase, filter junk domains and dedupe raw email matches in one pass."""
+    return sorted(dict.fromkeys(e for e in map(str.lower, found) if len(e) > 5 and not any(s in e for s in EMAIL_SKIP)))
 
 
-def extract_emails(text: str) -> list[str]:
+def extract_emails(text: str, stripped: bool = False) -> list[str]:
+    """Emails in text; pass stripped=True when text already went through strip_html."""
     if not text:
         return []
-    text = strip_html(text)
-    found = set(EMAIL_PATTERN.findall(text))
-    skip = ("example.com", "test.com", "duckduckgo.com", "google.com", "wixpress.com")
-    return sorted(e.lower() for e in found if not any(s in e.lower() for s in skip) and len(e) > 5)
+    if not stripped:
+        text = strip_html(text)
+    return clean_emails(EMAIL_PATTERN.findall(text))
 
 
-def extract_phones(text: str) -> list[str]:
+def country_region(country: str) -> str | None:
+    """ISO region for a CompanyInput.country (name or 2-letter code); None if unknown."""
+    c = country.strip()
+    if len(c) == 2 and c.upper() in phonenumbers.SUPPORTED_REGIONS:
+        return c.upper()
+    return COUNTRY_REGIONS.get(c.lower())
+
+
+def extract_phones(text: str, region: str | None = None, stripped: bool = False) -> list[str]:
+    """Valid E.164 phones in text (region enables national formats); stripped=True if text went through strip_html."""
     if not text:
         return []
-    text = strip_html(text)
-    valid = []
-    for m in PHONE_STRICT.finditer(text):
-        p = m.group(0).strip()
-        digits = re.sub(r"\D", "", p)
-        if 10 <= len(digits) <= 15:
-            valid.append(p)
-    if not valid:
-        for m in PHONE_PATTERN.finditer(text):
-            p = m.group(0).strip()
-            digits = re.sub(r"\D", "", p)
-            if 10 <= len(digits) <= 15 and "2147483647" not in digits:
-                valid.append(p)
-    seen = set()
-    ordered = []
-    for p in valid:
-        d = re.sub(r"\D", "", p)
-        if d not in seen:
-            seen.add(d)
-            ordered.append(p)
-    ordered.sort(key=lambda x: (0 if x.startswith("+") else 1, x))
-    return ordered[:10]
-
-
-def extract_social_links(html: str) -> list[str]:
-    links = set()
-    for p in (LINKEDIN_P, TWITTER_P, FACEBOOK_P):
-        links.update(p.findall(html))
-    return sorted(links)
+    if not stripped:
+        text = strip_html(text)
+    found = (
+        phonenumbers.format_number(m.number, phonenumbers.PhoneNumberFormat.E164)
+        for m in phonenumbers.PhoneNumberMatcher(text, region)
+        if "2147483647" not in m.raw_string  # JS INT_MAX leaks into page text and is a "valid" IN number
+    )
+    return list(dict.fromkeys(found))[:10]
+
+
+def extract_contacts(html: bytes) -> dict[str, list[str]]:
+    """One CONTACTS_RE pass over raw HTML bytes, bucketed by CONTACT_KINDS (socials, urls)."""
+    raw: dict[str, list[str]] = {kind: [] for kind in CONTACT_KINDS}
+    if not html:
+        return raw
+    pending = [html]
+    while pending:
+        for m in CONTACTS_RE.finditer(pending.pop()):
+            hit = m.group(0)
+            raw[CONTACT_KINDS[m.lastindex - 1]].append(hit.decode("utf-8", "replace"))
+            query = hit.find(b"?")
+            if query != -1:
+                # One decoded value per parameter, so "&sa=U" doesn't stick to a nested URL
+                pending.append(b" ".join(map(unquote_to_bytes, hit[query + 1:].split(b"&"))))
+    buckets = {kind: sorted(set(raw[kind])) for kind in ("linkedin", "twitter", "facebook")}
+    buckets["urls"] = raw["urls"]
+    return buckets
+
+
+def social_links_of(buckets: dict[str, list[str]]) -> list[str]:
+    return sorted({*buckets["linkedin"], *buckets["twitter"], *buckets["facebook"]})
+
+
+# ============ Domain Filtering ============
+
+def is_excluded_host(host: str) -> bool:
+    """True if host or one of its parent domains is in EXCLUDED_DOMAINS (m.facebook.com yes, notlinkedin.com no)."""
+    labels = host.lower().rstrip(".").split(".")
+    return any(".".join(labels[i:]) in EXCLUDED_DOMAINS for i in range(len(labels) - 1))
+
+
+def is_excluded_url(url: str) -> bool:
+    try:
+        return is_excluded_host(urlparse(url).hostname or "")
+    except ValueError:
+        return True
 
 
 # ============ Confidence Scoring ============
 
-def score_website_confidence(url: str, company_name: str, country: str) -> float:
-    """Return confidence score 0–1 for website URL."""
+def company_slug_of(company_name: str) -> str:
+    return NON_SLUG_RE.sub("", company_name.lower())[:15]
+
+
+def score_website_confidence(url: str, company_name: str, country: str, company_slug: str | None = None) -> float:
+    """Return confidence score 0–1 for website URL. Pass company_slug when scoring many URLs for one company."""
     try:
         parsed = urlparse(url)
         domain = (parsed.netloc or "").lower().replace("www.", "")
@@ -164,12 +347,12 @@ def score_website_confidence(url: str, company_name: str, country: str) -> float
     except Exception:
         return 0.0
 
-    for ex in EXCLUDED_DOMAINS:
-        if ex in domain:
-            return 0.0
+    if is_excluded_host(parsed.hostname or ""):
+        return 0.0
 
     score = 0.0
-    company_slug = re.sub(r"[^a-z0-9]", "", company_name.lower())[:15]
+    if company_slug is None:
+        company_slug = company_slug_of(company_name)
     if company_slug and company_slug in domain:
         score += 0.5
     if len(domain.split(".")) <= 2:
@@ -180,40 +363,94 @@ def score_website_confidence(url: str, company_name: str, country: str) -> float
 
 
 def pick_best_website(urls: list[str], company_name: str, country: str) -> tuple[str, float]:
-    """Select best URL with confidence score."""
-    scored = [(u, score_website_confidence(u, company_name, country)) for u in urls]
-    scored = [(u, s) for u, s in scored if s > 0]
-    if not scored:
+    """Select best URL with confidence score; the first URL reaching EARLY_ACCEPT_CONFIDENCE wins outright."""
+    company_slug = company_slug_of(company_name)
+    best_url, best_score = "", 0.0
+    for u in urls:
+        s = score_website_confidence(u, company_name, country, company_slug)
+        if s >= EARLY_ACCEPT_CONFIDENCE:
+            return u, s
+        if s > best_score:
+            best_url, best_score = u, s
+    if not best_url:
         return (urls[0], 0.0) if urls else ("", 0.0)
-    best = max(scored, key=lambda x: x[1])
-    return best[0], best[1]
+    return best_url, best_score
 
 
 # ============ Resource Blocking ============
 
-def block_resources(route: Route) -> None:
+async def block_resources(route: Route) -> None:
     rt = route.request.resource_type
-    if rt in ("image", "media", "font"):
-        route.abort()
+    host = (urlparse(route.request.url).hostname or "").lower()
+    if host.endswith(TRACKER_HOSTS):
+        await route.abort()
+    elif rt in BLOCKED_RESOURCE_TYPES and not (rt == "stylesheet" and host.endswith(KEEP_STYLE_HOSTS)):
+        await route.abort()
     else:
-        route.continue_()
+        await route.continue_()
+
+
+# ============ Browser Page Pool ============
+
+class BrowserPagePool:
+    """
+    Hands out pages on a shared browser, at most max_pages at a time.
+    Each page gets its own context (fresh cookies, rotated user agent/locale); the browser is never closed here.
+    """
+
+    def __init__(self, browser: Browser, max_pages: int = DEFAULT_CONCURRENCY) -> None:
+        self.browser = browser
+        self._sem = asyncio.Semaphore(max_pages)
+
+    async def acquire(self) -> Page:
+        await self._sem.acquire()
+        try:
+            context = await self.browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent=random.choice(USER_AGENTS),
+                locale=random.choice(LOCALES),
+                timezone_id="Asia/Kolkata",
+            )
+            # Context-level route so sibling pages (contact-path probes) are filtered too
+            await context.route("**/*", block_resources)
+            page = await context.new_page()
+        except Exception:
+            self._sem.release()
+            raise
+        return page
+
+    async def release(self, page: Page) -> None:
+        try:
+            await page.context.close()
+        finally:
+            self._sem.release()
 
 
 # ============ Delays ============
 
-def random_delay() -> None:
-    time.sleep(random.uniform(DELAY_MIN, DELAY_MAX))
+async def random_delay() -> None:
+    await asyncio.sleep(random.uniform(DELAY_MIN, DELAY_MAX))
+
+
+async def smart_delay(page: Page, selector: str | None = None, min_s: float = 0.3, max_s: float = 1.2) -> None:
+    """Small jitter, then return as soon as selector (if given) is on the page."""
+    await asyncio.sleep(random.uniform(min_s, max_s))
+    if selector:
+        try:
+            await page.wait_for_selector(selector, timeout=3000)
+        except PlaywrightTimeout:
+            pass
 
 
 # ============ Google Consent ============
 
-def handle_consent(page: Page) -> None:
+async def handle_consent(page: Page) -> None:
     try:
-        for text in ["Accept all", "I agree", "Accept", "Agree", "Accept All"]:
-            btn = page.get_by_role("button", name=re.compile(re.escape(text), re.I))
-            if btn.count() > 0:
-                btn.first.click(timeout=4000)
-                random_delay()
+        for pattern in CONSENT_BUTTON_RES:
+            btn = page.get_by_role("button", name=pattern)
+            if await btn.count() > 0:
+                await btn.first.click(timeout=4000)
+                await smart_delay(page, SEARCH_BOX)
                 return
     except Exception:
         pass
@@ -221,13 +458,13 @@ def handle_consent(page: Page) -> None:
 
 # ============ CAPTCHA Detection & Pause ============
 
-def detect_recaptcha(page: Page) -> bool:
+async def detect_recaptcha(page: Page) -> bool:
     """Detect if reCAPTCHA is present. Returns True if user must solve manually."""
     try:
-        html = page.content()
+        html = await page.content()
         if "recaptcha" not in html.lower() and "unusual traffic" not in html.lower():
             return False
-        if page.locator(".g-recaptcha, #captcha-form, iframe[src*='recaptcha']").count() > 0:
+        if await page.locator(".g-recaptcha, #captcha-form, iframe[src*='recaptcha']").count() > 0:
             return True
         if len(html) < 20000:
             return True
@@ -236,19 +473,19 @@ def detect_recaptcha(page: Page) -> bool:
     return False
 
 
-def wait_for_captcha_solve(page: Page, company_name: str) -> None:
-    """Pause and wait for user to manually solve CAPTCHA."""
-    CAPTCHA_ENCOUNTERS.append({"company": company_name, "url": page.url})
-    logger.warning("[CAPTCHA] Detected reCAPTCHA for company '%s'. Solve it manually in the browser.", company_name)
-    logger.warning("[CAPTCHA] Press Enter here when done to continue...")
-    input()
-    random_delay()
+async def wait_for_captcha_solve(page: Page, company_name: str) -> None:
+    """Pause and wait for user to manually solve CAPTCHA. Prompts are serialized across companies."""
+    async with CAPTCHA_LOCK:
+        CAPTCHA_ENCOUNTERS.append({"company": company_name, "url": page.url})
+        logger.warning("[CAPTCHA] Detected reCAPTCHA for company '%s'. Solve it manually in the browser.", company_name)
+        logger.warning("[CAPTCHA] Press Enter here when done to continue...")
+        await asyncio.to_thread(input)
 
 
 # ============ Knowledge Panel Extraction ============
 
-def extract_knowledge_panel(page: Page) -> dict[str, Any]:
-    """Extract visible contact info from Google knowledge panel if present."""
+async def extract_knowledge_panel(page: Page, hrefs: list[str], region: str | None = None) -> dict[str, Any]:
+    """Extract visible contact info from Google knowledge panel if present. hrefs are the page's http links."""
     data: dict[str, Any] = {"website": "", "phone": "", "address": ""}
     try:
         # Knowledge panel typically in right sidebar or specific divs
@@ -256,127 +493,157 @@ def extract_knowledge_panel(page: Page) -> dict[str, Any]:
                     ".knowledge-panel", "[role='complementary']", ".kp-wholepage"]:
             try:
                 el = page.locator(sel).first
-                if el.count() > 0:
-                    txt = el.inner_text(timeout=2000)
+                if await el.count() > 0:
+                    txt = await el.inner_text(timeout=2000)
                     if txt:
                         data["address"] = data["address"] or extract_address_heuristic(txt)
-                        data["phone"] = data["phone"] or (extract_phones(txt)[:1] or [""])[0]
+                        data["phone"] = data["phone"] or (extract_phones(txt, region, stripped=True)[:1] or [""])[0]
             except Exception:
                 continue
         # Links in knowledge panel
-        for a in page.locator("a[href^='http']").all():
+        for href in hrefs:
             try:
-                href = a.get_attribute("href")
                 if href and "google" not in href:
-                    d = (urlparse(href).netloc or "").lower()
-                    if not any(ex in d for ex in EXCLUDED_DOMAINS) and "maps" not in href:
+                    parsed = urlparse(href)
+                    d = (parsed.netloc or "").lower()
+                    if not is_excluded_host(parsed.hostname or "") and "maps" not in href:
                         if not data["website"] or len(d) < len(data["website"]):
                             data["website"] = href
-            except Exception:
+            except ValueError:
                 continue
     except Exception as e:
         logger.debug("Knowledge panel extraction: %s", e)
     return data
 
 
+def address_keywords(line: str) -> tuple[bool, bool]:
+    """(has a whole-word street keyword, has an address hint word) from one ADDR_AUTOMATON pass."""
+    low = line.lower()
+    street = hint = False
+    for end, (n, whole_word) in ADDR_AUTOMATON.iter(low):
+        if not whole_word:
+            hint = True
+        elif not (end - n >= 0 and low[end - n].isalnum()) and not (end + 1 < len(low) and low[end + 1].isalnum()):
+            street = True
+    return street, hint
+
+
+def has_contact_hint(text: str) -> bool:
+    return next(CONTACT_HINT_AUTOMATON.iter(text), None) is not None
+
+
 def extract_address_heuristic(text: str) -> str:
     """Heuristic: look for address-like patterns."""
     lines = [l.strip() for l in text.split("\n") if len(l.strip()) > 10 and len(l.strip()) < 200]
+    hinted = ""
     for line in lines:
-        if re.search(r"\d{4,6}", line) and (re.search(r"\b(street|st|road|rd|avenue|ave|floor|fl)\b", line, re.I) or "," in line):
+        street, hint = address_keywords(line)
+        if ADDR_ZIP_RE.search(line) and (street or "," in line):
             return " ".join(line.split())[:250]
-    for line in lines:
-        if "headquartered" in line.lower() or "located" in line.lower() or "address" in line.lower():
-            return " ".join(line.split())[:250]
-    return ""
+        # Zip+street lines anywhere beat the first "headquartered/located/address" line
+        if hint and not hinted:
+            hinted = line
+    return " ".join(hinted.split())[:250]
 
 
 # ============ Organic Results Extraction ============
 
-def extract_organic_urls(page: Page, company_name: str, country: str) -> tuple[list[str], dict[str, Any]]:
-    """Extract URLs from organic results and knowledge panel."""
+async def extract_organic_urls(
+    page: Page, company_name: str, country: str, html_urls: list[str]
+) -> tuple[list[str], dict[str, Any]]:
+    """Extract URLs from organic results and knowledge panel; html_urls are the URLs extract_contacts found in the page HTML."""
     urls: list[str] = []
     kp_data: dict[str, Any] = {}
 
     try:
-        kp_data = extract_knowledge_panel(page)
+        hrefs: list[str] = await page.eval_on_selector_all('a[href^="http"]', HREFS_JS)
+        kp_data = await extract_knowledge_panel(page, hrefs, country_region(country))
         if kp_data.get("website"):
             urls.append(kp_data["website"])
 
-        content = page.content()
-        for a in page.locator('a[href^="http"]').all():
+        for href in hrefs:
             try:
-                href = a.get_attribute("href")
                 if not href or "google.com" in href or "accounts.google" in href:
                     continue
-                domain = (urlparse(href).netloc or "").lower()
-                if any(ex in domain for ex in EXCLUDED_DOMAINS):
+                if is_excluded_url(href):
                     continue
                 urls.append(href)
-            except Exception:
+            except ValueError:
                 continue
 
         # Also extract from page HTML (AI Overview, snippets)
-        urls.extend(re.findall(r'https?://(?:www\.)?[a-zA-Z0-9][-a-zA-Z0-9]*\.(?:com|org|net|io|co|in)/[^\s"\'<>]*', content))
+        urls.extend(html_urls)
     except Exception as e:
         logger.warning("Organic extraction error: %s", e)
 
-    urls = list(dict.fromkeys(u for u in urls if not any(ex in u.lower() for ex in EXCLUDED_DOMAINS)))
+    urls = list(dict.fromkeys(u for u in urls if not is_excluded_url(u)))
     return urls[:20], kp_data
 
 
 # ============ Website Scraping ============
 
-def find_contact_page(page: Page, base_url: str) -> str | None:
+async def find_contact_page(page: Page, base_url: str) -> str | None:
     """Find contact-related page URL from current page links (no navigation)."""
     try:
         # Footer links first
-        for a in page.locator("footer a[href], [role='contentinfo'] a[href]").all():
-            try:
-                href = a.get_attribute("href")
-                text = (a.inner_text() or "").lower()
-                if href and any(h in text for h in CONTACT_LINK_HINTS):
-                    full = urljoin(base_url, href)
-                    if full.startswith("http") and "mailto:" not in full:
-                        return full
-            except Exception:
-                continue
+        for href, text in await page.eval_on_selector_all("footer a[href], [role='contentinfo'] a[href]", LINKS_JS):
+            if href and has_contact_hint(text):
+                full = urljoin(base_url, href)
+                if full.startswith("http") and "mailto:" not in full:
+                    return full
 
         # Any link with contact/about text
-        for a in page.locator("a[href]").all():
-            try:
-                href = a.get_attribute("href")
-                text = (a.inner_text() or "").lower()
-                if href and any(h in text for h in CONTACT_LINK_HINTS):
-                    full = urljoin(base_url, href)
-                    if full.startswith("http") and "mailto:" not in full and "tel:" not in full:
-                        return full
-            except Exception:
-                continue
+        for href, text in await page.eval_on_selector_all("a[href]", LINKS_JS):
+            if href and has_contact_hint(text):
+                full = urljoin(base_url, href)
+                if full.startswith("http") and "mailto:" not in full and "tel:" not in full:
+                    return full
     except Exception as e:
         logger.debug("Contact page find: %s", e)
     return None
 
 
-def scrape_website(page: Page, url: str) -> dict[str, Any]:
-    """Scrape contact info from company website."""
+async def probe_contact_paths(page: Page, base: str) -> Page | None:
+    """Load every CONTACT_PATHS URL at once on sibling pages of page's context.
+
+    Returns the first probe (in CONTACT_PATHS order) that answered 200, still open; the rest are closed.
+    """
+    urls = [urljoin(base, path) for path in CONTACT_PATHS]
+    probes = await asyncio.gather(*(page.context.new_page() for _ in urls))
+    responses = await asyncio.gather(
+        *(p.goto(u, wait_until="domcontentloaded", timeout=5000) for p, u in zip(probes, urls)),
+        return_exceptions=True,
+    )
+    winner = next(
+        (p for p, r in zip(probes, responses) if not isinstance(r, BaseException) and r and r.status == 200), None
+    )
+    await asyncio.gather(*(p.close() for p in probes if p is not winner), return_exceptions=True)
+    return winner
+
+
+async def scrape_website(page: Page, url: str, region: str | None = None) -> tuple[dict[str, Any], bool]:
+    """
+    Scrape contact info from company website; region is the phonenumbers hint for national numbers.
+    Also returns whether the visit completed (False after a timeout or error: data is then partial or empty).
+    """
     data: dict[str, Any] = {"emails": [], "phones": [], "address": "", "social_links": []}
+    ok = False
     try:
-        page.goto(url, wait_until="domcontentloaded", timeout=15000)
-        page.wait_for_load_state("domcontentloaded")
-        random_delay()
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        await smart_delay(page, min_s=0.2, max_s=0.6)
 
-        html = page.content()
-        data["emails"] = extract_emails(html)
-        data["phones"] = extract_phones(html)
-        data["social_links"] = extract_social_links(html)
+        html = await page.content()
+        text = strip_html(html)
+        data["emails"] = extract_emails(text, stripped=True)
+        data["phones"] = extract_phones(text, region, stripped=True)
+        data["social_links"] = social_links_of(extract_contacts(html.encode()))
 
         # Address from structured elements
         for sel in ['[itemprop="address"]', "address", "footer", '[class*="address"]']:
             try:
                 el = page.locator(sel).first
-                if el.count() > 0:
-                    txt = el.inner_text()
+                if await el.count() > 0:
+                    txt = await el.inner_text()
                     if txt and 15 < len(txt) < 400:
                         addr = extract_address_heuristic(txt)
                         if addr:
@@ -386,44 +653,36 @@ def scrape_website(page: Page, url: str) -> dict[str, Any]:
                 continue
 
         # mailto
-        for a in page.locator('a[href^="mailto:"]').all():
-            try:
-                h = a.get_attribute("href")
-                if h:
-                    e = h.replace("mailto:", "").split("?")[0].strip()
-                    if "@" in e and e not in data["emails"]:
-                        data["emails"].append(e.lower())
-            except Exception:
-                continue
-
-        # Contact page: from links or common paths
-        contact_url = find_contact_page(page, url)
+        for h in await page.eval_on_selector_all('a[href^="mailto:"]', HREFS_JS):
+            if h:
+                e = h.replace("mailto:", "").split("?")[0].strip()
+                if "@" in e and e not in data["emails"]:
+                    data["emails"].append(e.lower())
+
+        # Contact page: from links, else the first common path that answers 200 (already loaded in a probe page)
+        contact_url = await find_contact_page(page, url)
+        contact_page: Page | None = None
         if not contact_url:
-            base = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
-            for path in CONTACT_PATHS:
-                try:
-                    test = urljoin(base, path)
-                    r = page.goto(test, wait_until="domcontentloaded", timeout=5000)
-                    if r and r.status == 200:
-                        contact_url = test
-                        break
-                except Exception:
-                    page.goto(url, wait_until="domcontentloaded", timeout=5000)
-                    continue
+            contact_page = await probe_contact_paths(page, f"{urlparse(url).scheme}://{urlparse(url).netloc}")
+            contact_url = contact_page.url if contact_page else None
         if contact_url and contact_url != url:
             try:
-                page.goto(contact_url, wait_until="domcontentloaded", timeout=10000)
-                random_delay()
-                html2 = page.content()
-                data["emails"] = list(dict.fromkeys(data["emails"] + extract_emails(html2)))
-                data["phones"] = list(dict.fromkeys(data["phones"] + extract_phones(html2)))
-                data["social_links"] = list(dict.fromkeys(data["social_links"] + extract_social_links(html2)))
+                if contact_page:
+                    page = contact_page
+                else:
+                    await page.goto(contact_url, wait_until="domcontentloaded", timeout=10000)
+                    await smart_delay(page, min_s=0.2, max_s=0.6)
+                html2 = await page.content()
+                text2 = strip_html(html2)
+                data["emails"] = list(dict.fromkeys(data["emails"] + extract_emails(text2, stripped=True)))
+                data["phones"] = list(dict.fromkeys(data["phones"] + extract_phones(text2, region, stripped=True)))
+                data["social_links"] = list(dict.fromkeys(data["social_links"] + social_links_of(extract_contacts(html2.encode()))))
                 if not data["address"]:
                     for sel in ["address", "footer", '[itemprop="address"]']:
                         try:
                             el = page.locator(sel).first
-                            if el.count() > 0:
-                                txt = el.inner_text()
+                            if await el.count() > 0:
+                                txt = await el.inner_text()
                                 if txt and 15 < len(txt) < 400:
                                     data["address"] = extract_address_heuristic(txt)
                                     break
@@ -431,103 +690,216 @@ def scrape_website(page: Page, url: str) -> dict[str, Any]:
                             continue
             except Exception:
                 pass
+        if contact_page:
+            await contact_page.close()
+        ok = True
     except PlaywrightTimeout:
         logger.warning("Timeout scraping %s", url)
     except Exception as e:
         logger.warning("Website scrape error %s: %s", url, e)
 
-    return data
+    return data, ok
+
+
+# ============ Domain Guessing ============
+
+def country_tld(country: str) -> str:
+    return COUNTRY_TLDS.get(country.strip().lower(), "")
+
+
+def guess_domains(company_name: str, country: str) -> list[str]:
+    """Likely homepages for a company whose name maps cleanly to a domain (42Gears -> 42gears.com)."""
+    slug = NON_SLUG_RE.sub("", company_name.lower())
+    if len(slug) < 3:
+        return []
+    domains = [f"{slug}.{tld}" for tld in GUESS_TLDS]
+    tld = country_tld(country)
+    if tld and tld not in GUESS_TLDS:
+        domains.append(f"{slug}.{tld}")
+    return domains
+
+
+def _fetch_title(url: str) -> tuple[int, str, str, str]:
+    """Status, final URL (after redirects), lowercased <title> and lowercased head of the page."""
+    # Streamed: only the first TITLE_READ_BYTES are downloaded, never the whole homepage
+    with requests.get(url, headers={"User-Agent": USER_AGENTS[0]}, timeout=3, allow_redirects=True, stream=True) as r:
+        body = b""
+        for chunk in r.iter_content(chunk_size=16384):
+            body += chunk
+            if len(body) >= TITLE_READ_BYTES:
+                break
+        # requests would assume ISO-8859-1 for text/html without a charset
+        encoding = r.encoding if "charset" in r.headers.get("Content-Type", "") else "utf-8"
+        head = body[:TITLE_READ_BYTES].decode(encoding or "utf-8", "replace").lower()
+        status, final_url = r.status_code, r.url
+    m = TITLE_RE.search(head)
+    return status, final_url, (m.group(1) if m else ""), head
+
+
+def is_parked(final_url: str, head: str) -> bool:
+    return any(marker in final_url.lower() or marker in head for marker in PARKED_MARKERS)
+
+
+async def guess_website(company: CompanyInput) -> tuple[str, float]:
+    """
+    First guessed domain that resolves, answers 2xx/3xx with the full company slug in its title, isn't
+    parked, and whose final URL scores EARLY_ACCEPT_CONFIDENCE; ("", 0.0) if none does.
+    """
+    slug = NON_SLUG_RE.sub("", company.company_name.lower())
+    loop = asyncio.get_running_loop()
+    for domain in guess_domains(company.company_name, company.country):
+        try:
+            await loop.getaddrinfo(domain, 443)
+        except socket.gaierror:
+            continue
+        try:
+            status, final_url, title, head = await asyncio.to_thread(_fetch_title, f"https://{domain}")
+        except requests.RequestException:
+            continue
+        if not 200 <= status < 400 or slug not in NON_SLUG_RE.sub("", title) or is_parked(final_url, head):
+            continue
+        confidence = score_website_confidence(final_url, company.company_name, company.country)
+        if confidence >= EARLY_ACCEPT_CONFIDENCE:
+            return final_url, confidence
+    return "", 0.0
 
 
 # ============ Main Enrichment Flow ============
 
-def enrich_company(pw: Any, company: CompanyInput) -> CompanyResult:
-    """Enrich a single company. New browser per company to avoid repeated session."""
+async def search_google(page: Page, company: CompanyInput, result: CompanyResult) -> None:
+    """Google the company and fill result with SERP contacts and the best website candidate."""
+    query = f'"{company.company_name}" {company.country} official website contact'
+
+    # Google
+    await page.goto("https://www.google.com", wait_until="domcontentloaded", timeout=15000)
+    await smart_delay(page, SEARCH_BOX)
+    await handle_consent(page)
+
+    # Search
+    search = page.locator(SEARCH_BOX).first
+    await search.fill(query)
+    await smart_delay(page)
+    await search.press("Enter")
+    # Result container appears long before network idle (analytics beacons keep Google busy)
+    try:
+        await page.wait_for_selector(SERP_SELECTOR, timeout=10000)
+    except PlaywrightTimeout:
+        pass
+    await random_delay()
+
+    # CAPTCHA check
+    if await detect_recaptcha(page):
+        await wait_for_captcha_solve(page, company.company_name)
+        await page.wait_for_load_state("domcontentloaded")
+        await smart_delay(page, SERP_SELECTOR)
+
+    # Extract
+    html = await page.content()
+    buckets = extract_contacts(html.encode())  # socials and candidate URLs live in attributes
+    urls, kp = await extract_organic_urls(page, company.company_name, company.country, buckets["urls"])
+    # Emails and phones from visible text: raw HTML has script pseudo-addresses and misses info&#64;acme.com
+    text = strip_html(html)
+    result.emails = extract_emails(text, stripped=True)
+    result.phones = extract_phones(text, country_region(company.country), stripped=True)
+    result.social_links = social_links_of(buckets)
+    # Line-based heuristic, so it needs one line per text node (and none of the script/attribute soup)
+    result.address = kp.get("address") or extract_address_heuristic(strip_html(html, separator="\n"))
+
+    if kp.get("phone"):
+        result.phones = list(dict.fromkeys([kp["phone"]] + result.phones))
+    if kp.get("website"):
+        urls = list(dict.fromkeys([kp["website"]] + urls))
+
+    # Pick website
+    if urls:
+        best_url, confidence = pick_best_website(urls, company.company_name, company.country)
+        result.website = best_url
+        result.website_confidence = confidence
+        result.source = ["google"]
+
+
+async def enrich_company(
+    pool: BrowserPagePool, company: CompanyInput, cache: ResultCache | None = None, guess: bool = True
+) -> CompanyResult:
+    """Enrich a single company on a pooled page (fresh context per company to avoid repeated session)."""
+    if cache:
+        cached = cache.get(company)
+        if cached:
+            logger.info("Cache hit: %s", company.company_name)
+            return cached
+
     result = CompanyResult(
         company_name=company.company_name,
         country=company.country,
         sector=company.sector,
     )
 
-    browser = pw.chromium.launch(headless=False)
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080},
-        user_agent=USER_AGENT,
-        locale="en-IN",
-        timezone_id="Asia/Kolkata",
-    )
-    page = context.new_page()
-    page.route("**/*", block_resources)
+    # Taking the slot first keeps the DNS + HTTP guesses within --concurrency too
+    page = await pool.acquire()
 
+    cacheable = True  # False once the website visit failed
     try:
-        query = f'"{company.company_name}" {company.country} official website contact'
         logger.info("Processing: %s", company.company_name)
-
-        # Google
-        page.goto("https://www.google.com", wait_until="domcontentloaded", timeout=15000)
-        page.wait_for_load_state("domcontentloaded")
-        random_delay()
-        handle_consent(page)
-        random_delay()
-
-        # Search
-        search = page.locator('textarea[name="q"], input[name="q"]').first
-        search.fill(query)
-        random_delay()
-        search.press("Enter")
-        page.wait_for_load_state("networkidle", timeout=15000)
-        random_delay()
-
-        # CAPTCHA check
-        if detect_recaptcha(page):
-            wait_for_captcha_solve(page, company.company_name)
-            page.wait_for_load_state("domcontentloaded")
-            random_delay()
-
-        # Extract
-        urls, kp = extract_organic_urls(page, company.company_name, company.country)
-        result.emails = extract_emails(page.content())
-        result.phones = extract_phones(page.content())
-        result.social_links = extract_social_links(page.content())
-        result.address = kp.get("address") or extract_address_heuristic(page.content())
-
-        if kp.get("phone"):
-            result.phones = list(dict.fromkeys([kp["phone"]] + result.phones))
-        if kp.get("website"):
-            urls = list(dict.fromkeys([kp["website"]] + urls))
-
-        # Pick website
-        if urls:
-            best_url, confidence = pick_best_website(urls, company.company_name, company.country)
-            result.website = best_url
+        website, confidence = await guess_website(company) if guess else ("", 0.0)
+        if website:
+            logger.info("Guessed website for %s: %s (skipping Google)", company.company_name, website)
+            result.website = website
             result.website_confidence = confidence
-            result.source = ["google"]
+            result.source = ["guess"]
+        else:
+            await search_google(page, company, result)
 
         # Visit website
         if result.website:
-            try:
-                site_data = scrape_website(page, result.website)
-                result.emails = list(dict.fromkeys(result.emails + site_data["emails"]))
-                result.phones = list(dict.fromkeys(result.phones + site_data["phones"]))
-                result.social_links = list(dict.fromkeys(result.social_links + site_data["social_links"]))
-                if site_data["address"]:
-                    result.address = result.address or site_data["address"]
-                if "website" not in result.source:
-                    result.source.append("website")
-            except Exception as e:
-                logger.warning("Website visit failed for %s: %s", company.company_name, e)
+            site_data, visited = await scrape_website(page, result.website, country_region(company.country))
+            result.emails = list(dict.fromkeys(result.emails + site_data["emails"]))
+            result.phones = list(dict.fromkeys(result.phones + site_data["phones"]))
+            result.social_links = list(dict.fromkeys(result.social_links + site_data["social_links"]))
+            if site_data["address"]:
+                result.address = result.address or site_data["address"]
+            if visited and "website" not in result.source:
+                result.source.append("website")
+            if not visited:
+                cacheable = False
+
+        # Empty or failed lookups (CAPTCHA, no results, site errors) are retried next run, not cached for the TTL
+        if cache and cacheable and (result.website or result.emails or result.phones):
+            cache.put(company, result)
 
     except PlaywrightTimeout as e:
         logger.error("Timeout for %s: %s", company.company_name, e)
     except Exception as e:
         logger.error("Error for %s: %s", company.company_name, e)
     finally:
-        context.close()
-        browser.close()
+        await pool.release(page)
 
     return result
 
 
+async def enrich_all(
+    companies: list[CompanyInput], concurrency: int, sink: TextIO, cache: ResultCache | None = None, guess: bool = True
+) -> None:
+    """Enrich companies concurrently on one shared browser, appending each result to sink as a JSONL line."""
+
+    async def run_one(company: CompanyInput) -> None:
+        # One company's failure (e.g. pool.acquire() failing to open a context) must not end the gather
+        try:
+            r = await enrich_company(pool, company, cache, guess)
+        except Exception as e:
+            logger.error("Error for %s: %s", company.company_name, e)
+            r = CompanyResult(company_name=company.company_name, country=company.country, sector=company.sector)
+        sink.write(json.dumps(r.to_dict(), ensure_ascii=False) + "\n")
+        sink.flush()
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=False)
+        try:
+            pool = BrowserPagePool(browser, max_pages=concurrency)
+            await asyncio.gather(*(run_one(c) for c in companies))
+        finally:
+            await browser.close()
+
+
 # ============ I/O ============
 
 def load_companies(path: str) -> list[CompanyInput]:
@@ -554,20 +926,33 @@ def load_companies(path: str) -> list[CompanyInput]:
     return companies
 
 
-def save_results(results: list[CompanyResult], base: str) -> None:
+def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def save_results(jsonl_path: Path, base: str) -> None:
+    """Convert the streamed JSONL results into the final JSON and CSV files."""
     basepath = Path(base)
-    data = [r.to_dict() for r in results]
 
+    # One record in memory at a time; output matches json.dump(list, indent=2) byte for byte
     with open(basepath.with_suffix(".json"), "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-    if data:
-        with open(basepath.with_suffix(".csv"), "w", encoding="utf-8", newline="") as f:
-            w = csv.DictWriter(f, fieldnames=list(data[0].keys()))
-            w.writeheader()
-            for d in data:
-                row = {k: (", ".join(v) if isinstance(v, list) else v) for k, v in d.items()}
-                w.writerow(row)
+        f.write("[")
+        n = 0
+        for n, d in enumerate(iter_jsonl(jsonl_path), 1):
+            f.write(",\n" if n > 1 else "\n")
+            f.write(textwrap.indent(json.dumps(d, indent=2, ensure_ascii=False), "  "))
+        f.write("\n]" if n else "]")
+
+    with open(basepath.with_suffix(".csv"), "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        w.writeheader()
+        for d in iter_jsonl(jsonl_path):
+            w.writerow({k: (", ".join(v) if isinstance(v, list) else v) for k, v in d.items()})
 
     logger.info("Saved %s.json and %s.csv", basepath.with_suffix(".json"), basepath.with_suffix(".csv"))
 
@@ -585,6 +970,9 @@ def main() -> None:
     parser.add_argument("input", help="Input JSON or CSV")
     parser.add_argument("-o", "--output", default="enrichment_results", help="Output base path")
     parser.add_argument("--max", type=int, default=0, help="Max companies (0=all)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Companies enriched in parallel")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and don't update {CACHE_FILE.name}")
+    parser.add_argument("--no-guess", action="store_true", help="Always search Google instead of trying <name>.com etc. first")
     args = parser.parse_args()
 
     companies = load_companies(args.input)
@@ -592,15 +980,16 @@ def main() -> None:
         companies = companies[: args.max]
     logger.info("Loaded %d companies", len(companies))
 
-    results = []
-    with sync_playwright() as pw:
-        for i, c in enumerate(companies, 1):
-            logger.info("[%d/%d] %s", i, len(companies), c.company_name)
-            results.append(enrich_company(pw, c))
-            if i < len(companies):
-                random_delay()
-
-    save_results(results, args.output)
+    # Results stream to <output>.jsonl as they finish, so an interrupted run keeps what it got
+    jsonl_path = Path(args.output).with_suffix(".jsonl")
+    cache = None if args.no_cache else ResultCache()
+    try:
+        with open(jsonl_path, "w", encoding="utf-8") as sink:
+            asyncio.run(enrich_all(companies, max(1, args.concurrency), sink, cache, guess=not args.no_guess))
+    finally:
+        if cache:
+            cache.close()
+        save_results(jsonl_path, args.output)
     if CAPTCHA_ENCOUNTERS:
         logger.info("CAPTCHA was encountered %d time(s). See captcha_encounters.json", len(CAPTCHA_ENCOUNTERS))
 
@@ -7,21 +7,43 @@ Output: JSON and CSV with structured contact data
 """
 
 import argparse
+import asyncio
 import csv
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import random
 import re
+import sqlite3
 import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
 from urllib.parse import parse_qs, quote, unquote, urljoin, urlparse
 
+try:
+    import re2  # google-re2: linear-time DFA for the patterns scanned over whole pages
+except ImportError:
+    re2 = re
+
+try:
+    import phonenumbers  # libphonenumber port: validates against each country's dialing plan
+except ImportError:
+    phonenumbers = None
+
+import ahocorasick
+import orjson
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 
-from playwright.sync_api import Page, Route, sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import Browser, BrowserContext, Page, Route, async_playwright, TimeoutError as PlaywrightTimeout
 
 # ============ Configuration ============
 
@@ -76,27 +98,165 @@ for _d in ("zoominfo.com", "dial4trade.com", "zaubacorp.com", "cleartax.in",
            "bulwarktech.com", "bdsoft.in", "datanyze.com"):
     EXCLUDED_DOMAINS.add(_d)
 
-# Regex patterns for extraction
-EMAIL_PATTERN = re.compile(
-    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-    re.IGNORECASE
+# Entries that are host-name fragments rather than domains; these still match anywhere in the host
+EXCLUDED_HOST_MARKERS = ("press-release", "news.", "blog.")
+# Everything else matches the host exactly or as a parent domain (in.linkedin.com -> linkedin.com)
+EXCLUDED_EXACT = frozenset(d.rstrip(".") for d in EXCLUDED_DOMAINS if d not in EXCLUDED_HOST_MARKERS)
+
+# Regex patterns for extraction. Hot patterns (run over full page text) use RE2 when available;
+# RE2 takes no re.* flags, so case-insensitivity is inline (?i) and MULTILINE was never needed (no anchors)
+# Bounded to RFC lengths (64-char local part, 255-char domain, 24-char TLD) so asset URLs and
+# base64 blobs in tracker-heavy markup can't produce huge spans
+EMAIL_PATTERN = re2.compile(r"\b[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,255}\.[a-zA-Z]{2,24}\b")
+# Placeholder, asset and infrastructure addresses; any of these as a substring drops the match
+NEGATIVE_EMAIL_SUBSTRS = (
+    "example.com", "test.com", "domain.com", "duckduckgo.com", "wixpress.com",
+    ".png", ".jpg", ".gif", "xxx", "sentry.io", "google.com",
 )
-PHONE_PATTERN = re.compile(
-    r"(?:\+?\d{1,4}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{3,4}(?:[-.\s]?\d{2,4})?",
-    re.MULTILINE
+# Word-bounded with a mandatory area-code separator: no run of bare digits matches, and under the
+# re fallback there are no nested optional groups for long digit runs to backtrack through
+PHONE_PATTERN = re2.compile(
+    r"(?:\+\d{1,3}[ .-]?)?(?:\(\d{2,4}\)[ .-]?|\b\d{2,4}[ .-])\d{3,4}[ .-]?\d{3,4}\b"
+)
+# LinkedIn, Twitter/X and Facebook profile URLs in one alternation: a single pass over the page HTML
+SOCIAL_PATTERN = re2.compile(
+    r"(?i)https?://(?:www\.)?(?:linkedin\.com|twitter\.com|x\.com|facebook\.com|fb\.com)/[^\s\"'<>]+"
+)
+
+# DuckDuckGo HTML wraps result links as ...uddg=<url-encoded target>...
+UDDG_PATTERN = re.compile(r'uddg=([^&"\']+)')
+
+# Google consent buttons (labels vary by locale), tried in order
+CONSENT_BUTTON_PATTERNS = tuple(
+    re.compile(re.escape(text), re.I)
+    for text in ("Accept all", "I agree", "Accept", "Agree", "Accept All", "Allow all")
 )
-# Social media URL patterns
-LINKEDIN_PATTERN = re.compile(r"https?://(?:www\.)?linkedin\.com/[^\s\"'<>]+", re.I)
-TWITTER_PATTERN = re.compile(r"https?://(?:www\.)?(?:twitter\.com|x\.com)/[^\s\"'<>]+", re.I)
-FACEBOOK_PATTERN = re.compile(r"https?://(?:www\.)?(?:facebook|fb)\.com/[^\s\"'<>]+", re.I)
+CONSENT_FORM_PATTERN = re.compile("consent|accept|agree", re.I)
+# Accessible name of Google's search combobox
+SEARCH_BOX_PATTERN = re.compile("search", re.I)
+
+# Link reads are done in one page-side evaluate instead of a Playwright round-trip per element
+HREFS_JS = "els => els.map(e => e.href)"
+TEXTS_JS = "els => els.map(e => e.innerText || '')"
+
+# Organic result links; their appearance means the SERP has rendered (CAPTCHA pages never show them)
+SERP_RESULTS_SELECTOR = 'div#search a[href^="http"], div#rso a[href^="http"]'
+
+# Knowledge-panel rows that carry contact data on a Google SERP
+KNOWLEDGE_PANEL_SELECTOR = '[data-attrid*="phone"], [data-attrid*="email"], [data-attrid*="address"]'
+
+# AI Overview: walk up from the marker text to the first ancestor with a substantial block of text.
+# One constant string, so the page's V8 sees an identical script (and can reuse its compile) each call
+AI_OVERVIEW_MARKERS = ("AI Overview", "Key Contact Information")
+AI_OVERVIEW_JS = """
+el => {
+    let p = el;
+    for (let i = 0; i < 8 && p; i++) {
+        const text = p.innerText || '';
+        if (text.length > 150 && text.length < 8000) return text;
+        p = p.parentElement;
+    }
+    return '';
+}
+"""
+
+# Pages are read at most CONTENT_CAP chars from the top plus the last quarter of that from the
+# bottom (footer addresses/phones); sliced in the page so oversized DOMs never cross the bridge
+CONTENT_CAP = 500_000
+BOUNDED_HTML_JS = """
+cap => {
+    const h = document.documentElement.outerHTML;
+    return h.length <= cap ? h : h.slice(0, cap) + h.slice(-Math.floor(cap / 4));
+}
+"""
+
+# Elements that usually hold a postal address, in preference order
+ADDRESS_SELECTORS = [
+    '[itemprop="address"]',
+    'address',
+    '[class*="address"]',
+    '[class*="contact"]',
+    'footer',
+]
+CONTACT_BLOCK_SELECTOR = ", ".join(ADDRESS_SELECTORS)
+
+# Company sites are first fetched over plain HTTP; a body smaller than this, or without a closing
+# </body>, is taken for a JS shell and the site is loaded in the browser instead
+STATIC_MIN_HTML = 2000
+# So is one with little visible text, or little per external script (SPA shells pad the HTML with
+# preload links and inline state, so only the rendered text tells them apart)
+STATIC_MIN_TEXT = 400
+STATIC_TEXT_PER_SCRIPT = 150
 
 # Contact-related link text hints
 CONTACT_LINK_HINTS = ["contact", "contact us", "about", "about us", "reach us", "get in touch", "support"]
 
+
+def build_automaton(words: Iterable[str]) -> ahocorasick.Automaton:
+    """Aho-Corasick automaton: one linear pass over a string tests every word at once."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+def contains_any(automaton: ahocorasick.Automaton, text: str) -> bool:
+    return next(automaton.iter(text), None) is not None
+
+
+# Substring keyword sets; exact/parent-domain exclusions are set lookups in EXCLUDED_EXACT
+EXCLUDED_MARKER_AUTOMATON = build_automaton(EXCLUDED_HOST_MARKERS)
+CONTACT_HINT_AUTOMATON = build_automaton(CONTACT_LINK_HINTS)
+
 # Realistic delay range (seconds)
 MIN_DELAY = 1.5
 MAX_DELAY = 3.5
 
+# Resource blocking: we only ever read HTML/text, so skip everything that only affects rendering
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+TRACKER_HOSTS = (
+    "googletagmanager.com", "google-analytics.com", "doubleclick.net", "hotjar.com",
+    "segment.io", "facebook.net", "adservice.google.com",
+)
+KEEP_STYLE_HOSTS = ("google.com", "gstatic.com")
+
+# Companies processed at once (one browser context each)
+DEFAULT_CONCURRENCY = 4
+
+# On-disk caches so re-running the same input skips the network: raw HTTP responses (DuckDuckGo)
+# via requests-cache, and finished CompanyResults keyed by (company_name, country)
+HTTP_CACHE_FILE = Path(__file__).parent / "scraper_http_cache.sqlite"
+HTTP_CACHE_TTL = 24 * 3600
+RESULT_CACHE_FILE = Path(__file__).parent / "scraper_cache.sqlite"
+RESULT_CACHE_TTL = 30 * 24 * 3600  # seconds; older entries are re-scraped
+
+# Google consent cookies saved after the first accepted popup and loaded into every later context,
+# plus a persistent Chromium disk cache for static assets shared by all contexts
+GOOGLE_STATE_FILE = Path(__file__).parent / ".google_state.json"
+BROWSER_CACHE_DIR = Path(__file__).parent / ".chromium_cache"
+BROWSER_CACHE_SIZE = 100 * 1024 * 1024
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def configure_session(session: requests.Session) -> requests.Session:
+    """Shared headers plus a pooled adapter (keep-alive across calls/threads) that backs off on 429/5xx."""
+    retry = Retry(total=2, backoff_factor=1.5, status_forcelist=[429, 502, 503])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+
+# Session for plain HTTP fetches; main() swaps in a CachedSession unless --no-cache
+http_session: requests.Session = configure_session(requests.Session())
+
 
 # ============ Data Models ============
 
@@ -133,12 +293,80 @@ class CompanyResult:
         }
 
 
+# ============ Result Cache ============
+
+def cache_key(company: CompanyInput) -> str:
+    """
+    Readable slug of name and country, plus a hash of the whitespace-normalized originals:
+    the slugs alone collide ("Tech India"/"" vs "Tech"/"India") and are empty for non-Latin names.
+    """
+    name = " ".join(company.company_name.lower().split())
+    country = " ".join(company.country.lower().split())
+    digest = hashlib.sha1(f"{name}\0{country}".encode()).hexdigest()[:16]
+    return f"{NON_SLUG_RE.sub('', name)}:{NON_SLUG_RE.sub('', country)}:{digest}"
+
+
+class ResultCache:
+    """SQLite store of finished CompanyResults keyed by normalized (company_name, country)."""
+
+    def __init__(self, path: Path = RESULT_CACHE_FILE, ttl: int = RESULT_CACHE_TTL) -> None:
+        self.ttl = ttl
+        # --workers processes share the file; wait on their write locks instead of failing
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts INTEGER, payload TEXT)")
+
+    def get(self, company: CompanyInput) -> CompanyResult | None:
+        row = self.conn.execute(
+            "SELECT payload FROM cache WHERE key = ? AND ts > ?",
+            (cache_key(company), int(time.time()) - self.ttl),
+        ).fetchone()
+        return CompanyResult(**json.loads(row[0])) if row else None
+
+    def put(self, company: CompanyInput, result: CompanyResult) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cache (key, ts, payload) VALUES (?, ?, ?)",
+            (cache_key(company), int(time.time()), json.dumps(result.to_dict(), ensure_ascii=False)),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
 # ============ URL Scoring ============
 
-def score_website_url(url: str, company_name: str, country: str) -> float:
+def is_excluded_domain(domain: str) -> bool:
+    """True for aggregator/social/news hosts (domain may carry a port or a trailing dot)."""
+    domain = domain.lower().split(":")[0].rstrip(".")
+    if contains_any(EXCLUDED_MARKER_AUTOMATON, domain):
+        return True
+    # One hash lookup per label (m.facebook.com -> facebook.com) instead of an endswith per excluded domain
+    labels = domain.split(".")
+    return any(".".join(labels[i:]) in EXCLUDED_EXACT for i in range(len(labels) - 1))
+
+
+# Scoring constants (hoisted so the per-URL loop allocates nothing)
+NON_SLUG_RE = re.compile(r"[^a-z0-9]")
+COUNTRY_HINTS = ("uk", "de", "fr", "in", "ae")
+LOW_VALUE_PATHS = ("/news/", "/blog/", "/article/", "/tag/", "/author/")
+
+
+def canonical_url(url: str) -> tuple[str, str, str]:
+    """Dedup key for candidate URLs: ignores www., trailing slash, query (utm_*/ref) and fragment."""
+    p = urlparse(url)
+    return p.scheme, p.netloc.lower().removeprefix("www."), p.path.rstrip("/")
+
+
+def company_keys(company_name: str, country: str) -> tuple[str, str]:
+    """Per-company invariants of score_website_url: (company slug, country key)."""
+    return NON_SLUG_RE.sub("", company_name.lower())[:15], country.lower().replace(" ", "")[:10]
+
+
+def score_website_url(url: str, company_name: str, country: str, keys: tuple[str, str] | None = None) -> float:
     """
     Score a URL to pick the best candidate for the official company website.
     Higher score = more likely to be the official site.
+    Pass keys=company_keys(company_name, country) when scoring many URLs for one company.
     """
     try:
         parsed = urlparse(url)
@@ -150,33 +378,29 @@ def score_website_url(url: str, company_name: str, country: str) -> float:
     score = 0.0
 
     # Exclude known aggregator/social domains
-    for excluded in EXCLUDED_DOMAINS:
-        if excluded in domain or domain.endswith("." + excluded):
-            return -1000.0
+    if is_excluded_domain(domain):
+        return -1000.0
 
     # Prefer shorter, cleaner domains
-    domain_parts = domain.replace("www.", "").split(".")
-    base_domain = domain_parts[0] if domain_parts else ""
-    if len(domain_parts) <= 2:
+    if domain.replace("www.", "").count(".") <= 1:
         score += 2.0  # company.com vs sub.company.co.uk
 
+    company_slug, country_lower = keys or company_keys(company_name, country)
     # Boost if company name (simplified) appears in domain
-    company_slug = re.sub(r"[^a-z0-9]", "", company_name.lower())[:15]
     if company_slug and company_slug in domain:
         score += 5.0
     # Country TLD or in domain can help
-    country_lower = country.lower().replace(" ", "")[:10]
-    if country_lower and (country_lower in domain or any(c in domain for c in ["uk", "de", "fr", "in", "ae"])):
+    if country_lower and (country_lower in domain or any(c in domain for c in COUNTRY_HINTS)):
         score += 0.5
 
     # Penalize long paths (often article/news pages)
     if len(path) > 30:
         score -= 1.0
-    if any(x in path for x in ["/news/", "/blog/", "/article/", "/tag/", "/author/"]):
+    if any(x in path for x in LOW_VALUE_PATHS):
         score -= 2.0
 
     # Penalize known low-value TLDs
-    if domain.endswith(".pdf") or domain.endswith(".doc"):
+    if domain.endswith((".pdf", ".doc")):
         score -= 5.0
 
     return score
@@ -184,7 +408,8 @@ def score_website_url(url: str, company_name: str, country: str) -> float:
 
 def pick_best_website(urls: list[str], company_name: str, country: str) -> str:
     """From a list of URLs, return the one with the highest score."""
-    scored = [(url, score_website_url(url, company_name, country)) for url in urls]
+    keys = company_keys(company_name, country)
+    scored = [(url, score_website_url(url, company_name, country, keys)) for url in urls]
     scored = [(u, s) for u, s in scored if s > 0]
     if not scored:
         return urls[0] if urls else ""
@@ -193,62 +418,110 @@ def pick_best_website(urls: list[str], company_name: str, country: str) -> str:
 
 # ============ Extraction Helpers ============
 
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Never visible text; their bodies were a steady source of junk emails/phones
+NON_TEXT_TAGS = ["script", "style", "noscript"]
+
+
 def strip_html(text: str) -> str:
-    """Remove HTML tags from text."""
+    """Visible text of an HTML document (entities decoded, script/style bodies dropped)."""
     if not text:
         return ""
-    return re.sub(r"<[^>]+>", " ", text).replace("&nbsp;", " ").replace("&amp;", "&")
+    try:
+        tree = LexborHTMLParser(text)
+        tree.strip_tags(NON_TEXT_TAGS)
+        # &nbsp; decodes to U+00A0, which RE2's ASCII \s would not treat as a separator
+        return tree.text(separator=" ").replace("\xa0", " ")
+    except Exception:
+        return HTML_TAG_RE.sub(" ", text).replace("&nbsp;", " ").replace("&amp;", "&")
 
 
-def extract_emails(text: str) -> list[str]:
-    """Extract and normalize email addresses from text."""
+def extract_emails(text: str, stripped: bool = False) -> list[str]:
+    """Extract and normalize email addresses from text (stripped=True: text already went through strip_html)."""
     if not text:
         return []
-    text = strip_html(text)
+    if not stripped:
+        text = strip_html(text)
     found = set(EMAIL_PATTERN.findall(text))
     # Basic validation - filter obvious non-emails
-    skip_domains = ("example.com", "test.com", "domain.com", "duckduckgo.com", "wixpress.com")
-    skip_suffixes = (".png", ".jpg", ".gif", "xxx", "sentry.io", "google.com")
     valid = []
     for e in found:
         e = e.strip().lower()
         if len(e) > 5 and "@" in e and "." in e.split("@")[-1]:
-            if not any(x in e for x in skip_domains):
-                if not any(e.endswith(x) or x in e for x in skip_suffixes):
-                    valid.append(e)
+            if not any(x in e for x in NEGATIVE_EMAIL_SUBSTRS):
+                valid.append(e)
     return sorted(set(valid))
 
 
 # Stricter patterns for real phone numbers (reduces false positives from prices, IDs)
-PHONE_INTERNATIONAL = re.compile(r"\+\d{1,4}[-.\s]?\d{2,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}(?:[-.\s]?\d{2,4})?")
-PHONE_INDIAN = re.compile(r"(?:\+91|91|0)?[-.\s]?\d{4,5}[-.\s]?\d{5}")
+PHONE_INTERNATIONAL = re2.compile(r"\+\d{1,4}[-.\s]?\d{2,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}(?:[-.\s]?\d{2,4})?")
+PHONE_INDIAN = re2.compile(r"(?:\+91|91|0)?[-.\s]?\d{4,5}[-.\s]?\d{5}")
+# Delete table for digit-stripping phone matches: every non-digit Latin-1 char plus the Unicode
+# spaces \s can match under the re fallback (covers everything the phone patterns admit)
+_DIGIT_ONLY = str.maketrans("", "", "".join(
+    chr(c) for c in range(0x3001) if (c < 256 and not 48 <= c <= 57) or chr(c).isspace()
+))
+
+
+# Region hint for phonenumbers so national-format numbers parse; unknown countries default to India
+DEFAULT_PHONE_REGION = "IN"
+COUNTRY_REGIONS = {
+    "india": "IN", "united kingdom": "GB", "uk": "GB", "germany": "DE", "france": "FR",
+    "united arab emirates": "AE", "uae": "AE", "lithuania": "LT", "netherlands": "NL", "spain": "ES",
+    "italy": "IT", "singapore": "SG", "australia": "AU", "canada": "CA", "japan": "JP",
+    "saudi arabia": "SA", "switzerland": "CH", "sweden": "SE", "poland": "PL", "israel": "IL",
+    "united states": "US", "usa": "US",
+}
+PHONE_JUNK_DIGITS = frozenset({"2147483647", "1234567890", "12345678901", "9999999999"})
+
 
+def phone_region(country: str) -> str:
+    """ISO region for a CompanyInput.country (name or 2-letter code)."""
+    c = country.strip()
+    region = COUNTRY_REGIONS.get(c.lower())  # first, so "UK" maps to GB
+    if region:
+        return region
+    if len(c) == 2 and c.isalpha() and (phonenumbers is None or c.upper() in phonenumbers.SUPPORTED_REGIONS):
+        return c.upper()
+    return DEFAULT_PHONE_REGION
 
-def extract_phones(text: str) -> list[str]:
-    """Extract and normalize phone numbers from text. Prefers international/Indian formats."""
+
+def extract_phones(text: str, stripped: bool = False, region: str = DEFAULT_PHONE_REGION) -> list[str]:
+    """Extract valid phone numbers from text in international format; region parses national formats."""
     if not text:
         return []
-    text = strip_html(text)
-    valid = []
+    if not stripped:
+        text = strip_html(text)
+    if phonenumbers is None:
+        return _extract_phones_regex(text)
+    found = (
+        phonenumbers.format_number(m.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+        for m in phonenumbers.PhoneNumberMatcher(text, region)
+        if str(m.number.national_number) not in PHONE_JUNK_DIGITS
+    )
+    return list(dict.fromkeys(found))[:10]  # Limit to 10 most likely
+
+
+def _extract_phones_regex(text: str) -> list[str]:
+    """Regex fallback for extract_phones when phonenumbers is not installed. Prefers international/Indian formats."""
+    valid = []  # (match, digits) so the dedup pass doesn't strip again
     for pattern in (PHONE_INTERNATIONAL, PHONE_INDIAN):
         for m in pattern.finditer(text):
             p = m.group(0).strip()
-            digits = re.sub(r"\D", "", p)
+            digits = p.translate(_DIGIT_ONLY)
             if 10 <= len(digits) <= 15:
-                valid.append(p)
+                valid.append((p, digits))
     if not valid:
         for m in PHONE_PATTERN.finditer(text):
             p = m.group(0).strip()
-            digits = re.sub(r"\D", "", p)
+            digits = p.translate(_DIGIT_ONLY)
             if 10 <= len(digits) <= 12 and not any(c in p for c in [".", "e", "E"]):
-                valid.append(p)
+                valid.append((p, digits))
     # Prefer international format (+XX) and deduplicate; filter junk
-    junk_digits = {"2147483647", "1234567890", "12345678901", "9999999999"}
     seen = set()
     ordered = []
-    for p in valid:
-        digits = re.sub(r"\D", "", p)
-        if digits in seen or digits in junk_digits:
+    for p, digits in valid:
+        if digits in seen or digits in PHONE_JUNK_DIGITS:
             continue
         seen.add(digits)
         ordered.append(p)
@@ -259,16 +532,12 @@ def extract_phones(text: str) -> list[str]:
 
 def extract_social_links(html: str) -> list[str]:
     """Extract LinkedIn, Twitter, Facebook URLs from page."""
-    links = set()
-    for pattern in (LINKEDIN_PATTERN, TWITTER_PATTERN, FACEBOOK_PATTERN):
-        links.update(pattern.findall(html))
-    return sorted(links)
+    return sorted(set(SOCIAL_PATTERN.findall(html)))
 
 
 # Domain pattern for bare domains in text (e.g. "42gears.com" in AI Overview)
-DOMAIN_PATTERN = re.compile(
-    r"(?:https?://)?(?:www\.)?([a-zA-Z0-9][-a-zA-Z0-9]*\.(?:com|org|net|io|co|in|de|uk|fr|ae)[^\s\"'<>]*)",
-    re.IGNORECASE
+DOMAIN_PATTERN = re2.compile(
+    r"(?i)(?:https?://)?(?:www\.)?([a-zA-Z0-9][-a-zA-Z0-9]*\.(?:com|org|net|io|co|in|de|uk|fr|ae)[^\s\"'<>]*)"
 )
 # Address/location hints in text
 ADDRESS_HINT_PATTERN = re.compile(
@@ -277,28 +546,30 @@ ADDRESS_HINT_PATTERN = re.compile(
 )
 
 
-def extract_domains_from_text(text: str) -> list[str]:
+def extract_domains_from_text(text: str, stripped: bool = False) -> list[str]:
     """Extract website domains from text (e.g. AI Overview '42gears.com')."""
     if not text:
         return []
-    text = strip_html(text)
+    if not stripped:
+        text = strip_html(text)
     found = []
     for m in DOMAIN_PATTERN.finditer(text):
         domain = m.group(1).rstrip(".,;:)")
         if "/" in domain:
             domain = domain.split("/")[0]
         domain = domain.lower()
-        if not any(ex in domain for ex in EXCLUDED_DOMAINS):
+        if not is_excluded_domain(domain):
             full = f"https://{domain}" if not domain.startswith("http") else domain
             found.append(full)
     return list(dict.fromkeys(found))
 
 
-def extract_address_from_text(text: str) -> str:
+def extract_address_from_text(text: str, stripped: bool = False) -> str:
     """Extract address/location hints like 'headquartered in Bengaluru'."""
     if not text:
         return ""
-    text = strip_html(text)
+    if not stripped:
+        text = strip_html(text)
     for m in ADDRESS_HINT_PATTERN.finditer(text):
         addr = m.group(1).strip()
         if 3 < len(addr) < 150:
@@ -306,28 +577,34 @@ def extract_address_from_text(text: str) -> str:
     return ""
 
 
-def get_ai_overview_text(page: Page) -> str:
+def extract_all(html: str, hints: bool = True, region: str = DEFAULT_PHONE_REGION) -> dict[str, Any]:
+    """
+    Strip html once and run every extractor over the result.
+    Returns emails, phones and social_links; with hints, also address and domains (text-hint extractors).
+    region is the phone-number region hint (see phone_region).
+    """
+    cleaned = strip_html(html)
+    data: dict[str, Any] = {
+        "emails": extract_emails(cleaned, stripped=True),
+        "phones": extract_phones(cleaned, stripped=True, region=region),
+        "social_links": extract_social_links(html),  # hrefs live in the markup, not the text
+    }
+    if hints:
+        data["address"] = extract_address_from_text(cleaned, stripped=True)
+        data["domains"] = extract_domains_from_text(cleaned, stripped=True)
+    return data
+
+
+async def get_ai_overview_text(page: Page) -> str:
     """
     Extract text from Google's AI Overview section if present.
     Uses flexible text-based locators; traverses DOM to find the overview block.
     """
-    for marker in ["AI Overview", "Key Contact Information"]:
+    for marker in AI_OVERVIEW_MARKERS:
         try:
             loc = page.get_by_text(marker, exact=False).first
             # Use evaluate to traverse up and find a parent block with substantial content
-            txt = loc.evaluate(
-                """
-                el => {
-                    let p = el;
-                    for (let i = 0; i < 8 && p; i++) {
-                        const text = p.innerText || '';
-                        if (text.length > 150 && text.length < 8000) return text;
-                        p = p.parentElement;
-                    }
-                    return '';
-                }
-                """
-            )
+            txt = await loc.evaluate(AI_OVERVIEW_JS)
             if txt and len(txt) > 150:
                 return txt
         except Exception:
@@ -335,48 +612,61 @@ def get_ai_overview_text(page: Page) -> str:
     return ""
 
 
+def _dedupe(*iterables: Iterable[str]) -> list[str]:
+    """Order-preserving union; chains the inputs instead of concatenating them into a temporary list."""
+    return list(dict.fromkeys(chain(*iterables)))
+
+
 def normalize_result(result: CompanyResult) -> CompanyResult:
     """Deduplicate and normalize extracted data."""
-    result.emails = list(dict.fromkeys(result.emails))
-    result.phones = list(dict.fromkeys(result.phones))
-    result.social_links = list(dict.fromkeys(result.social_links))
+    result.emails = _dedupe(result.emails)
+    result.phones = _dedupe(result.phones)
+    result.social_links = _dedupe(result.social_links)
     if result.address:
         result.address = " ".join(result.address.split())
     return result
 
 
+async def _bounded_content(page: Page, cap: int = CONTENT_CAP) -> str:
+    """Page HTML, truncated to the head and footer when it is larger than cap."""
+    return await page.evaluate(BOUNDED_HTML_JS, cap)
+
+
 # ============ CAPTCHA & Fallback Detection ============
 
-def is_google_captcha_page(page: Page) -> bool:
+async def is_google_captcha_page(page: Page) -> bool:
     """Detect if Google returned CAPTCHA instead of search results."""
     try:
-        html = page.content()
+        # Pages under the cap come back whole, so the < 20000 length check below is unaffected
+        html = await _bounded_content(page)
         if "recaptcha" in html.lower() or "unusual traffic" in html.lower():
             if len(html) < 20000:  # Real SERP is usually 50KB+
                 return True
-            if page.locator("#captcha-form, .g-recaptcha").count() > 0:
+            if await page.locator("#captcha-form, .g-recaptcha").count() > 0:
                 return True
-            if page.locator("div.g").count() == 0:  # No organic results
+            if await page.locator("div.g").count() == 0:  # No organic results
                 return True
     except Exception:
         pass
     return False
 
 
+def is_duckduckgo_error(html: str) -> bool:
+    """DDG's error and rate-limit pages come back as 200s."""
+    return "Error getting results" in html or len(html) < 3000
+
+
 def fetch_duckduckgo_html(query: str) -> str:
-    """Fetch DuckDuckGo HTML via requests (avoids browser detection)."""
+    """Fetch DuckDuckGo HTML via requests (avoids browser detection); error pages are evicted from the HTTP cache."""
     url = f"https://html.duckduckgo.com/html/?q={quote(query)}"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-    r = requests.get(url, headers=headers, timeout=15)
+    r = http_session.get(url, timeout=15)
     r.raise_for_status()
+    if is_duckduckgo_error(r.text):
+        forget_static_html(url)  # else every rerun within HTTP_CACHE_TTL replays it
     return r.text
 
 
-def extract_from_duckduckgo(page: Page, company_name: str, country: str) -> tuple[list[str], CompanyResult]:
+async def extract_from_duckduckgo(page: Page, company_name: str, country: str) -> tuple[list[str], CompanyResult]:
     """
     Search via DuckDuckGo HTML. Uses requests (not Playwright) to avoid bot detection.
     Extracts URLs from uddg redirect links and contact info from snippets.
@@ -392,17 +682,18 @@ def extract_from_duckduckgo(page: Page, company_name: str, country: str) -> tupl
     try:
         # Shorter query ranks official site higher; "contact" skews DDG to directories
         query = f'"{company_name}" {country} official website'
-        html = fetch_duckduckgo_html(query)
-        _random_delay(0.5, 1)
+        # requests is blocking; run it off the event loop so other companies keep going
+        html = await asyncio.to_thread(fetch_duckduckgo_html, query)
+        await _random_delay(0.5, 1)
 
         # Skip if DDG returned error page
-        if "Error getting results" in html or len(html) < 3000:
+        if is_duckduckgo_error(html):
             logger.warning("DuckDuckGo returned error or empty page")
             return candidate_urls, result
 
         # Extract target URLs from DuckDuckGo redirect links: ...uddg=URL_ENCODED...
-        uddg_pattern = re.compile(r'uddg=([^&"\']+)')
-        for m in uddg_pattern.finditer(html):
+        by_canonical: dict[tuple[str, str, str], str] = {}
+        for m in UDDG_PATTERN.finditer(html):
             try:
                 decoded = unquote(m.group(1))
                 if not decoded.startswith("http"):
@@ -411,20 +702,22 @@ def extract_from_duckduckgo(page: Page, company_name: str, country: str) -> tupl
                     continue
                 parsed = urlparse(decoded)
                 domain = (parsed.netloc or "").lower()
-                if any(ex in domain for ex in EXCLUDED_DOMAINS):
+                if is_excluded_domain(domain):
                     continue
-                candidate_urls.append(decoded)
+                by_canonical.setdefault(canonical_url(decoded), decoded)
             except Exception:
                 continue
+        candidate_urls = list(by_canonical.values())
 
         # Extract contact info from page text (snippets contain emails, phones, addresses)
-        result.emails = extract_emails(html)
-        result.phones = extract_phones(html)
-        result.social_links = extract_social_links(html)
-        result.address = extract_address_from_text(html) or ""
-        ai_domains = extract_domains_from_text(html)
+        found = extract_all(html, region=phone_region(country))
+        result.emails = found["emails"]
+        result.phones = found["phones"]
+        result.social_links = found["social_links"]
+        result.address = found["address"]
+        ai_domains = found["domains"]
         if ai_domains:
-            candidate_urls = list(dict.fromkeys(ai_domains + candidate_urls))
+            candidate_urls = _dedupe(ai_domains, candidate_urls)
 
         if candidate_urls:
             best = pick_best_website(candidate_urls[:20], company_name, country)
@@ -438,34 +731,46 @@ def extract_from_duckduckgo(page: Page, company_name: str, country: str) -> tupl
 
 # ============ Google Consent ============
 
-def handle_google_consent(page: Page) -> None:
-    """Dismiss Google consent/cookie popup if present."""
+async def handle_google_consent(page: Page) -> bool:
+    """Dismiss Google consent/cookie popup if present; True if a consent button was clicked."""
     try:
         # Try common consent button texts (vary by locale)
-        for text in ["Accept all", "I agree", "Accept", "Agree", "Accept All", "Allow all"]:
-            btn = page.get_by_role("button", name=re.compile(re.escape(text), re.I))
-            if btn.count() > 0:
-                btn.first.click(timeout=3000)
-                _random_delay(1, 2)
-                return
+        for name in CONSENT_BUTTON_PATTERNS:
+            btn = page.get_by_role("button", name=name)
+            if await btn.count() > 0:
+                await btn.first.click(timeout=3000)
+                await _random_delay(1, 2)
+                return True
         # Fallback: try form submit
-        form = page.locator("form").filter(has_text=re.compile("consent|accept|agree", re.I)).first
-        if form.count() > 0:
-            form.get_by_role("button").first.click(timeout=2000)
+        form = page.locator("form").filter(has_text=CONSENT_FORM_PATTERN).first
+        if await form.count() > 0:
+            await form.get_by_role("button").first.click(timeout=2000)
+            return True
     except Exception:
         pass  # No consent popup or already dismissed
+    return False
+
+
+async def save_google_state(page: Page) -> None:
+    """Write the context's cookies (just the Google consent ones at this point) for later contexts."""
+    state = await page.context.storage_state()
+    # Write-then-rename: concurrent contexts may be reading the file while the first one saves it
+    tmp = GOOGLE_STATE_FILE.with_suffix(f".{os.getpid()}.{id(page)}.tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, GOOGLE_STATE_FILE)
 
 
 # ============ Google Search ============
 
-def _random_delay(lo: float = MIN_DELAY, hi: float = MAX_DELAY) -> None:
-    time.sleep(random.uniform(lo, hi))
+async def _random_delay(lo: float = MIN_DELAY, hi: float = MAX_DELAY) -> None:
+    await asyncio.sleep(random.uniform(lo, hi))
 
 
-def extract_from_google_results(page: Page, company_name: str, country: str) -> tuple[list[str], CompanyResult]:
+async def extract_from_google_results(page: Page, company_name: str, country: str) -> tuple[list[str], CompanyResult]:
     """
     Extract candidate URLs and any visible contact info from Google search results.
-    Handles AI Overview section when present for richer contact data.
+    Contact data only comes from the knowledge panel and AI Overview; the rest of the SERP is
+    Google's own markup and yielded nothing but tracker links and infrastructure numbers.
     Returns (list of candidate URLs, partial CompanyResult with google-sourced data).
     """
     result = CompanyResult(
@@ -477,46 +782,47 @@ def extract_from_google_results(page: Page, company_name: str, country: str) ->
     candidate_urls: list[str] = []
 
     try:
-        # Get full page content for regex extraction
-        content = page.content()
-        result.emails = extract_emails(content)
-        result.phones = extract_phones(content)
-        result.social_links = extract_social_links(content)
+        region = phone_region(country)
+        panel_text = "\n".join(await page.eval_on_selector_all(KNOWLEDGE_PANEL_SELECTOR, TEXTS_JS))
+        if panel_text:
+            found = extract_all(panel_text, region=region)
+            result.emails = found["emails"]
+            result.phones = found["phones"]
+            result.address = found["address"]
 
         # Try to extract from AI Overview section (richer structured data)
-        ai_text = get_ai_overview_text(page)
+        ai_text = await get_ai_overview_text(page)
         ai_domains: list[str] = []
         if ai_text:
             logger.debug("Found AI Overview section")
-            ai_emails = extract_emails(ai_text)
-            ai_phones = extract_phones(ai_text)
-            if ai_emails:
-                result.emails = list(dict.fromkeys(ai_emails + result.emails))
-            if ai_phones:
-                result.phones = list(dict.fromkeys(ai_phones + result.phones))
-            ai_domains = extract_domains_from_text(ai_text)
+            ai = extract_all(ai_text, region=region)
+            if ai["emails"]:
+                result.emails = _dedupe(ai["emails"], result.emails)
+            if ai["phones"]:
+                result.phones = _dedupe(ai["phones"], result.phones)
+            ai_domains = ai["domains"]
             if not result.address:
-                result.address = extract_address_from_text(ai_text)
+                result.address = ai["address"]
 
         # Collect organic result links - use flexible selectors
-        links = page.locator('a[href^="http"]').all()
-        seen = set()
+        hrefs: list[str] = await page.eval_on_selector_all('a[href^="http"]', HREFS_JS)
+        # First spelling of each canonical URL wins, so tracking-param variants don't crowd the top 15
+        by_canonical: dict[tuple[str, str, str], str] = {}
 
-        for link in links:
+        for href in hrefs:
             try:
-                href = link.get_attribute("href")
-                if not href or "google.com" in href or "accounts.google" in href or href in seen:
+                if not href or "google.com" in href or "accounts.google" in href:
                     continue
                 if not href.startswith("http"):
                     continue
                 parsed = urlparse(href)
                 domain = (parsed.netloc or "").lower()
-                if any(ex in domain for ex in EXCLUDED_DOMAINS):
+                if is_excluded_domain(domain):
                     continue
-                candidate_urls.append(href)
-                seen.add(href)
+                by_canonical.setdefault(canonical_url(href), href)
             except Exception:
                 continue
+        candidate_urls = list(by_canonical.values())
 
         # Pick best URL: prefer organic links, fallback to AI Overview domains
         if candidate_urls:
@@ -535,29 +841,169 @@ def extract_from_google_results(page: Page, company_name: str, country: str) ->
 
 # ============ Website Scraping ============
 
-def find_contact_section_url(page: Page, base_url: str) -> str | None:
-    """Find a Contact/About page URL from the homepage."""
+def fetch_static_html(url: str) -> tuple[str, str] | None:
+    """
+    Company page over plain HTTP (blocking; run via asyncio.to_thread), with its final URL after
+    redirects (the base for relative links, as page.url is in the browser).
+    None when it fails or doesn't look server-rendered, so the caller falls back to the browser.
+    """
     try:
-        links = page.locator("a[href]").all()
-        for link in links:
-            try:
-                href = link.get_attribute("href")
-                text = (link.inner_text() or "").lower()
-                if not href or not text:
-                    continue
-                full_url = urljoin(base_url, href)
-                if any(hint in text for hint in CONTACT_LINK_HINTS):
-                    if full_url.startswith("http") and "mailto:" not in full_url and "tel:" not in full_url:
-                        return full_url
-            except Exception:
-                continue
-    except Exception:
-        pass
+        r = http_session.get(url, timeout=10)
+    except requests.RequestException:
+        return None
+    ctype = r.headers.get("Content-Type", "")
+    if r.status_code != 200 or "html" not in ctype:
+        return None
+    if "charset" not in ctype:
+        r.encoding = "utf-8"  # requests would assume ISO-8859-1 for text/html
+    html = r.text
+    if len(html) < STATIC_MIN_HTML or "</body>" not in html[-CONTENT_CAP:].lower():
+        return None
+    # Same head + footer window _bounded_content takes in the page
+    if len(html) > CONTENT_CAP:
+        html = html[:CONTENT_CAP] + html[-(CONTENT_CAP // 4):]
+    if looks_client_rendered(html):
+        return None
+    return html, r.url
+
+
+def looks_client_rendered(html: str) -> bool:
+    """True for an SPA shell: too little visible body text overall, or per <script src>."""
+    tree = LexborHTMLParser(html)
+    scripts = len(tree.css("script[src]"))
+    tree.strip_tags(NON_TEXT_TAGS)
+    text = len(tree.body.text(separator=" ", strip=True)) if tree.body else 0
+    return text < STATIC_MIN_TEXT or text < scripts * STATIC_TEXT_PER_SCRIPT
+
+
+def forget_static_html(url: str) -> None:
+    """Drop url from the HTTP cache, so a soft-error, shell or DDG error page isn't served again for HTTP_CACHE_TTL."""
+    cache = getattr(http_session, "cache", None)  # only a CachedSession has one
+    if cache is not None:
+        cache.delete(urls=[url])
+
+
+def address_from_tree(tree: LexborHTMLParser, need_digit: bool = True) -> str:
+    """First ADDRESS_SELECTORS element with a plausible address (10-499 chars; homepage ones need a digit)."""
+    for sel in ADDRESS_SELECTORS:
+        node = tree.css_first(sel)
+        if node is None:
+            continue
+        txt = node.text(separator=" ").strip()
+        if 10 < len(txt) < 500 and (not need_digit or any(c.isdigit() for c in txt)):
+            return " ".join(txt.split())[:300]
+    return ""
+
+
+def contact_url_from_tree(tree: LexborHTMLParser, base_url: str) -> str | None:
+    """First link whose text reads like Contact/About (CONTACT_LINK_HINTS), resolved against base_url."""
+    for a in tree.css("a[href]"):
+        href = a.attributes.get("href") or ""
+        text = a.text().lower()
+        if not href or not text or not contains_any(CONTACT_HINT_AUTOMATON, text):
+            continue
+        full_url = urljoin(base_url, href)
+        if full_url.startswith("http") and "mailto:" not in full_url and "tel:" not in full_url:
+            return full_url
     return None
 
 
-def scrape_website_contacts(page: Page, url: str) -> dict[str, Any]:
-    """Scrape contact info from a company website."""
+def mailto_emails(hrefs: Iterable[str]) -> list[str]:
+    emails = []
+    for href in hrefs:
+        if href and "mailto:" in href:
+            email = href.replace("mailto:", "").split("?")[0].strip()
+            if email and "@" in email:
+                emails.append(email.lower())
+    return emails
+
+
+def page_contacts(
+    html: str, base_url: str, region: str = DEFAULT_PHONE_REGION, need_digit: bool = True
+) -> tuple[dict[str, Any], str | None]:
+    """
+    Everything read from one company page, parsed once in-process: extract_all plus the address
+    selectors and mailto links from the selectolax tree. Also returns the page's contact link, if any.
+    """
+    data = extract_all(html, hints=False, region=region)
+    tree = LexborHTMLParser(html)
+    data["address"] = address_from_tree(tree, need_digit)
+    data["emails"].extend(mailto_emails(a.attributes.get("href") for a in tree.css('a[href^="mailto:"]')))
+    return data, contact_url_from_tree(tree, base_url)
+
+
+def merge_contact_page(data: dict[str, Any], found: dict[str, Any]) -> None:
+    data["emails"].extend(found["emails"])
+    data["phones"].extend(found["phones"])
+    data["social_links"].extend(found["social_links"])
+    data["address"] = data["address"] or found["address"]
+
+
+async def scrape_static_contacts(url: str, region: str = DEFAULT_PHONE_REGION) -> dict[str, Any] | None:
+    """
+    scrape_website_contacts over plain HTTP (homepage + contact page). None if the homepage needs a
+    browser, or if nothing was found: the site may fill its contacts in with JS.
+    """
+    fetched = await asyncio.to_thread(fetch_static_html, url)
+    if fetched is None:
+        return None
+    html, final_url = fetched
+    data, contact_url = page_contacts(html, final_url, region)
+    if contact_url and contact_url not in (url, final_url):
+        contact = await asyncio.to_thread(fetch_static_html, contact_url)
+        if contact is not None:
+            merge_contact_page(data, page_contacts(*contact, region, need_digit=False)[0])
+    if not (data["emails"] or data["phones"] or data["address"]):
+        await asyncio.to_thread(forget_static_html, url)
+        return None
+    return data
+
+
+async def _wait_for_contact_block(page: Page) -> None:
+    """
+    Wait until any address/contact/footer element is in the DOM (pages are loaded with
+    wait_until="commit"); SPAs that never render one get a short pause instead. Either way the
+    document must then finish parsing: an attached element can sit in a still-streaming DOM.
+    """
+    try:
+        await page.wait_for_selector(CONTACT_BLOCK_SELECTOR, state="attached", timeout=4000)
+    except PlaywrightTimeout:
+        await _random_delay(0.3, 0.6)
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=8000)
+    except PlaywrightTimeout:
+        pass  # slow tail; read what has arrived
+
+
+# Per-run memo of website scrapes by (canonical URL, region): rows sharing a website (duplicate rows,
+# subsidiaries) scrape it once, and a row arriving while the first scrape is running awaits that task
+_SITE_CACHE: dict[tuple[str, ...], asyncio.Task[dict[str, Any]]] = {}
+
+
+async def scrape_website_contacts(page: Page, url: str, region: str = DEFAULT_PHONE_REGION) -> dict[str, Any]:
+    """
+    Scrape contact info from a company website (region: phone-number region hint).
+    Server-rendered sites are read over plain HTTP; the browser is only driven for JS-rendered ones.
+    """
+    key = (*canonical_url(url), region)
+    task = _SITE_CACHE.get(key)
+    if task is None:
+        task = _SITE_CACHE[key] = asyncio.ensure_future(_scrape_website_contacts(page, url, region))
+    else:
+        logger.info("Website already scraped this run: %s", url)
+    data = await asyncio.shield(task)
+    # Callers extend these lists; hand each one its own copy
+    return {k: list(v) if isinstance(v, list) else v for k, v in data.items()}
+
+
+async def _scrape_website_contacts(page: Page, url: str, region: str) -> dict[str, Any]:
+    try:
+        static = await scrape_static_contacts(url, region)
+        if static is not None:
+            return static
+    except Exception as e:
+        logger.debug("Static fetch failed for %s: %s", url, e)
+
     data: dict[str, Any] = {
         "emails": [],
         "phones": [],
@@ -566,71 +1012,23 @@ def scrape_website_contacts(page: Page, url: str) -> dict[str, Any]:
     }
 
     try:
-        page.goto(url, wait_until="domcontentloaded", timeout=15000)
-        _random_delay(1.5, 2.5)
-
-        html = page.content()
-        data["emails"] = extract_emails(html)
-        data["phones"] = extract_phones(html)
-        data["social_links"] = extract_social_links(html)
-
-        # Try to find address in structured elements
-        addr_selectors = [
-            '[itemprop="address"]',
-            'address',
-            '[class*="address"]',
-            '[class*="contact"]',
-            'footer',
-        ]
-        for sel in addr_selectors:
-            try:
-                el = page.locator(sel).first
-                if el.count() > 0:
-                    txt = el.inner_text()
-                    if txt and len(txt) > 10 and len(txt) < 500:
-                        phones_in_txt = extract_phones(txt)
-                        if phones_in_txt or any(c.isdigit() for c in txt):
-                            data["address"] = " ".join(txt.split())[:300]
-                            break
-            except Exception:
-                continue
+        await page.goto(url, wait_until="commit", timeout=15000)
+        await _wait_for_contact_block(page)
+
+        # One content read per page; selectors, links and mailtos are then queried on the parsed HTML
+        found, contact_url = page_contacts(await _bounded_content(page), page.url, region)
+        data.update(found)
 
         # Try Contact page for more data
-        contact_url = find_contact_section_url(page, url)
         if contact_url and contact_url != url:
             try:
-                page.goto(contact_url, wait_until="domcontentloaded", timeout=10000)
-                _random_delay(1, 2)
-                html2 = page.content()
-                data["emails"].extend(extract_emails(html2))
-                data["phones"].extend(extract_phones(html2))
-                data["social_links"].extend(extract_social_links(html2))
-                if not data["address"]:
-                    for sel in addr_selectors:
-                        try:
-                            el = page.locator(sel).first
-                            if el.count() > 0:
-                                txt = el.inner_text()
-                                if txt and 10 < len(txt) < 500:
-                                    data["address"] = " ".join(txt.split())[:300]
-                                    break
-                        except Exception:
-                            continue
+                await page.goto(contact_url, wait_until="commit", timeout=10000)
+                await _wait_for_contact_block(page)
+                found, _ = page_contacts(await _bounded_content(page), page.url, region, need_digit=False)
+                merge_contact_page(data, found)
             except Exception:
                 pass
 
-        # mailto links
-        mailto_links = page.locator('a[href^="mailto:"]').all()
-        for a in mailto_links:
-            try:
-                href = a.get_attribute("href")
-                if href and "mailto:" in href:
-                    email = href.replace("mailto:", "").split("?")[0].strip()
-                    if email and "@" in email:
-                        data["emails"].append(email.lower())
-            except Exception:
-                continue
-
     except Exception as e:
         logger.warning("Error scraping website %s: %s", url, e)
 
@@ -639,73 +1037,116 @@ def scrape_website_contacts(page: Page, url: str) -> dict[str, Any]:
 
 # ============ Route Blocking (Performance) ============
 
-def block_resources(route: Route) -> None:
-    """Block images, fonts, and media to speed up scraping."""
+async def block_resources(route: Route) -> None:
+    """
+    Block images, fonts, media, stylesheets and tracker/ad hosts to speed up scraping.
+    Stylesheets from Google hosts are let through: the AI Overview needs CSS to render for inner_text.
+    """
     resource_type = route.request.resource_type
-    if resource_type in ("image", "media", "font"):
-        route.abort()
+    host = (urlparse(route.request.url).hostname or "").lower()
+    if host.endswith(TRACKER_HOSTS):
+        await route.abort()
+    elif resource_type in BLOCKED_RESOURCE_TYPES and not (
+        resource_type == "stylesheet" and host.endswith(KEEP_STYLE_HOSTS)
+    ):
+        await route.abort()
     else:
-        route.continue_()
+        await route.continue_()
 
 
 # ============ Main Scraper ============
 
-def process_company(
-    playwright_context: Any,
+async def new_scrape_context(browser: Browser, block_ads: bool = True) -> BrowserContext:
+    """A long-lived context for one concurrency slot; companies run in it as fresh tabs."""
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 720},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        locale="en-US",
+        storage_state=str(GOOGLE_STATE_FILE) if GOOGLE_STATE_FILE.exists() else None,
+    )
+    if block_ads:
+        # Registered once per context, so every tab opened in it is filtered
+        await context.route("**/*", block_resources)
+    return context
+
+
+async def process_company(
+    contexts: asyncio.Queue[BrowserContext],
     company: CompanyInput,
-    block_ads: bool = True,
     use_duckduckgo: bool = False,
-    headless: bool = True,
+    cache: ResultCache | None = None,
 ) -> CompanyResult:
-    """Process a single company: Google search + website scrape."""
+    """Process a single company: Google search + website scrape, in a new tab of a pooled context.
+
+    Taking a context from the queue bounds how many companies are in flight; cached companies never take one.
+    """
+    if cache:
+        cached = cache.get(company)
+        if cached:
+            logger.info("Cache hit: %s", company.company_name)
+            return cached
+    context = await contexts.get()
+    try:
+        logger.info("Processing: %s", company.company_name)
+        result, found = await _process_company(context, company, use_duckduckgo)
+        # Empty or failed lookups (CAPTCHA, timeouts, no results) are retried next run, not cached for the TTL
+        if cache and found:
+            cache.put(company, result)
+        # Brief pause before this slot picks up the next company
+        await _random_delay(2, 4)
+    finally:
+        contexts.put_nowait(context)
+    return result
+
+
+async def _process_company(
+    context: BrowserContext, company: CompanyInput, use_duckduckgo: bool
+) -> tuple[CompanyResult, bool]:
+    """The result, and whether it is worth caching: the run completed and the search returned something."""
+    found = False
     result = CompanyResult(
         company_name=company.company_name,
         country=company.country,
         sector=company.sector,
     )
-    browser = playwright_context.chromium.launch(headless=headless)
-    context = browser.new_context(
-        viewport={"width": 1280, "height": 720},
-        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        locale="en-US",
-    )
-    page = context.new_page()
-
-    if block_ads:
-        page.route("**/*", block_resources)
+    page = await context.new_page()
 
     try:
         query = f'"{company.company_name}" {company.country} official website contact'
         logger.info("Searching: %s", query)
 
         if use_duckduckgo:
-            candidate_urls, search_result = extract_from_duckduckgo(
+            candidate_urls, search_result = await extract_from_duckduckgo(
                 page, company.company_name, company.country
             )
         else:
-            page.goto("https://www.google.com", wait_until="domcontentloaded", timeout=15000)
-            _random_delay(1, 2)
-            handle_google_consent(page)
-            _random_delay(0.5, 1)
+            await page.goto("https://www.google.com", wait_until="domcontentloaded", timeout=15000)
+            await _random_delay(1, 2)
+            if await handle_google_consent(page):
+                await save_google_state(page)
+            await _random_delay(0.5, 1)
 
             # Search - try Google first
-            search_box = page.get_by_role("combobox", name=re.compile("search", re.I))
-            if search_box.count() == 0:
+            search_box = page.get_by_role("combobox", name=SEARCH_BOX_PATTERN)
+            if await search_box.count() == 0:
                 search_box = page.locator('textarea[name="q"], input[name="q"]')
-            search_box.first.fill(query)
-            _random_delay(0.3, 0.7)
-            search_box.first.press("Enter")
-            page.wait_for_load_state("domcontentloaded")
-            _random_delay(2, 3)
+            await search_box.first.fill(query)
+            await _random_delay(0.3, 0.7)
+            await search_box.first.press("Enter")
+            await page.wait_for_load_state("domcontentloaded")
+            try:
+                await page.wait_for_selector(SERP_RESULTS_SELECTOR, timeout=5000)
+            except PlaywrightTimeout:
+                pass  # CAPTCHA or an unusual layout; the checks below sort it out
 
             # Detect CAPTCHA and fallback to DuckDuckGo
-            if is_google_captcha_page(page):
+            if await is_google_captcha_page(page):
                 logger.warning("Google showed CAPTCHA - falling back to DuckDuckGo")
-                candidate_urls, search_result = extract_from_duckduckgo(
+                candidate_urls, search_result = await extract_from_duckduckgo(
                     page, company.company_name, company.country
                 )
             else:
-                candidate_urls, search_result = extract_from_google_results(
+                candidate_urls, search_result = await extract_from_google_results(
                     page, company.company_name, company.country
                 )
 
@@ -718,24 +1159,24 @@ def process_company(
 
         # Visit official website if we found one
         if result.website:
-            website_data = scrape_website_contacts(page, result.website)
-            result.emails = list(dict.fromkeys(result.emails + website_data["emails"]))
-            result.phones = list(dict.fromkeys(result.phones + website_data["phones"]))
-            result.social_links = list(dict.fromkeys(result.social_links + website_data["social_links"]))
+            website_data = await scrape_website_contacts(page, result.website, phone_region(company.country))
+            result.emails = _dedupe(result.emails, website_data["emails"])
+            result.phones = _dedupe(result.phones, website_data["phones"])
+            result.social_links = _dedupe(result.social_links, website_data["social_links"])
             if website_data["address"]:
                 result.address = result.address or website_data["address"]
             if "website" not in result.source:
                 result.source.append("website")
 
+        found = bool(candidate_urls or result.website or result.emails or result.phones)
     except PlaywrightTimeout as e:
         logger.error("Timeout for %s: %s", company.company_name, e)
     except Exception as e:
         logger.error("Error processing %s: %s", company.company_name, e)
     finally:
-        context.close()
-        browser.close()
+        await page.close()
 
-    return normalize_result(result)
+    return normalize_result(result), found
 
 
 # ============ I/O ============
@@ -776,36 +1217,122 @@ def load_companies(path: str) -> list[CompanyInput]:
     return companies
 
 
-def save_results(results: list[CompanyResult], output_base: str) -> None:
-    """Save results to JSON and CSV."""
+CSV_FIELDS = [f.name for f in fields(CompanyResult)]
+
+
+def write_jsonl(sink: BinaryIO, result: CompanyResult) -> None:
+    """Append one result to the per-run JSONL log (flushed, so a crash keeps everything written so far)."""
+    sink.write(orjson.dumps(result.to_dict()) + b"\n")
+    sink.flush()
+
+
+def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    if not path.exists():
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def save_results(jsonl_path: Path, output_base: str) -> int:
+    """Convert the streamed JSONL results into JSON and CSV in one pass; returns the number of companies."""
     base = Path(output_base)
     json_path = base.with_suffix(".json")
     csv_path = base.with_suffix(".csv")
 
-    # JSON
-    data = [r.to_dict() for r in results]
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    logger.info("Saved JSON: %s", json_path)
-
-    # CSV
-    if not data:
-        return
-    fieldnames = list(data[0].keys())
-    # Flatten lists for CSV
-    rows = []
-    for d in data:
-        row = {k: (", ".join(v) if isinstance(v, list) else v) for k, v in d.items()}
-        rows.append(row)
-    with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    n = 0
+    with open(json_path, "wb") as jf, open(csv_path, "w", encoding="utf-8", newline="") as cf:
+        writer = csv.DictWriter(cf, fieldnames=CSV_FIELDS)
         writer.writeheader()
-        writer.writerows(rows)
+        # JSON array written element by element (same layout as one indent-2 dump); nothing is held in memory
+        jf.write(b"[")
+        for n, d in enumerate(iter_jsonl(jsonl_path), 1):
+            # orjson escapes newlines inside strings, so every raw newline is structural and safe to indent
+            jf.write(b",\n  " if n > 1 else b"\n  ")
+            jf.write(orjson.dumps(d, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+            # Flatten lists for CSV
+            writer.writerow({k: (", ".join(v) if isinstance(v, list) else v) for k, v in d.items()})
+        jf.write(b"\n]\n" if n else b"]\n")
+    logger.info("Saved JSON: %s", json_path)
     logger.info("Saved CSV: %s", csv_path)
+    return n
 
 
 # ============ Entry Point ============
 
+async def run_all(
+    companies: list[CompanyInput],
+    args: argparse.Namespace,
+    sink: BinaryIO,
+    cache: ResultCache | None = None,
+    browser_cache_dir: Path = BROWSER_CACHE_DIR,
+) -> None:
+    """Process companies concurrently (one pooled context per --concurrency slot) on one shared browser.
+
+    Each result is written to sink as a JSONL line as soon as its company finishes.
+    """
+    contexts: asyncio.Queue[BrowserContext] = asyncio.Queue()
+
+    async def run_one(company: CompanyInput) -> None:
+        try:
+            result = await process_company(contexts, company, use_duckduckgo=args.duckduckgo, cache=cache)
+        except Exception as e:
+            logger.error("Error processing %s: %s", company.company_name, e)
+            result = CompanyResult(company_name=company.company_name, country=company.country, sector=company.sector)
+        write_jsonl(sink, result)
+
+    async with async_playwright() as p:
+        # One browser for the whole run and one context per slot; each company only pays for a new tab
+        browser = await p.chromium.launch(
+            headless=not args.headed,
+            args=[f"--disk-cache-dir={browser_cache_dir}", f"--disk-cache-size={BROWSER_CACHE_SIZE}"],
+        )
+        try:
+            for _ in range(max(1, args.concurrency)):
+                contexts.put_nowait(await new_scrape_context(browser, block_ads=not args.no_block))
+            await asyncio.gather(*(run_one(c) for c in companies))
+        finally:
+            await browser.close()
+
+
+def run_shard(companies: list[CompanyInput], args: argparse.Namespace, jsonl_path: Path, worker: int = 0) -> None:
+    """
+    Scrape companies end to end into jsonl_path: own event loop, browser and cache handles.
+    Runs in the main process, or once per --workers process (each with its own Chromium disk cache).
+    """
+    global http_session
+    cache = None
+    if not args.no_cache:
+        http_session = configure_session(requests_cache.CachedSession(
+            str(HTTP_CACHE_FILE), backend="sqlite", expire_after=HTTP_CACHE_TTL
+        ))
+        cache = ResultCache()
+    browser_cache_dir = BROWSER_CACHE_DIR / f"worker{worker}" if worker else BROWSER_CACHE_DIR
+    try:
+        with open(jsonl_path, "wb") as sink:
+            asyncio.run(run_all(companies, args, sink, cache, browser_cache_dir))
+    finally:
+        if cache:
+            cache.close()
+
+
+def run_sharded(companies: list[CompanyInput], args: argparse.Namespace, jsonl_path: Path, workers: int) -> None:
+    """Split companies round-robin over worker processes and merge their JSONL parts into jsonl_path."""
+    parts = [jsonl_path.with_suffix(f".part{i}.jsonl") for i in range(workers)]
+    shards = [companies[i::workers] for i in range(workers)]
+    try:
+        # spawn, not fork: each worker starts its own Playwright driver subprocess from scratch
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            pool.starmap(run_shard, zip(shards, repeat(args), parts, range(1, workers + 1)))
+    finally:
+        with open(jsonl_path, "wb") as out:
+            for part in parts:
+                if part.exists():
+                    out.write(part.read_bytes())
+                    part.unlink()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Scrape company contact details via Google + website")
     parser.add_argument("input", help="Input JSON or CSV file with company_name, country, sector")
@@ -814,6 +1341,15 @@ def main() -> None:
     parser.add_argument("--max", type=int, default=0, help="Max companies to process (0=all)")
     parser.add_argument("--duckduckgo", action="store_true", help="Use DuckDuckGo instead of Google (avoids CAPTCHA)")
     parser.add_argument("--headed", action="store_true", help="Run browser in headed mode (visible)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Companies processed in parallel")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Processes to shard companies across, each with its own browser (CPU-bound extraction scales past the GIL)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Ignore and don't update {RESULT_CACHE_FILE.name} / {HTTP_CACHE_FILE.name}",
+    )
     args = parser.parse_args()
 
     companies = load_companies(args.input)
@@ -821,23 +1357,17 @@ def main() -> None:
         companies = companies[: args.max]
     logger.info("Loaded %d companies", len(companies))
 
-    results: list[CompanyResult] = []
-    with sync_playwright() as p:
-        for i, company in enumerate(companies, 1):
-            logger.info("[%d/%d] Processing: %s", i, len(companies), company.company_name)
-            result = process_company(
-                p, company,
-                block_ads=not args.no_block,
-                use_duckduckgo=args.duckduckgo,
-                headless=not args.headed,
-            )
-            results.append(result)
-            # Brief pause between companies
-            if i < len(companies):
-                time.sleep(random.uniform(2, 4))
-
-    save_results(results, args.output)
-    logger.info("Done. Processed %d companies.", len(results))
+    # Results land in <output>.jsonl as they finish; JSON/CSV are built from it even after a crash
+    jsonl_path = Path(args.output).with_suffix(".jsonl")
+    workers = max(1, min(args.workers, len(companies)))
+    try:
+        if workers > 1:
+            run_sharded(companies, args, jsonl_path, workers)
+        else:
+            run_shard(companies, args, jsonl_path)
+    finally:
+        count = save_results(jsonl_path, args.output)
+    logger.info("Done. Processed %d companies.", count)
 
 
 if __name__ == "__main__":
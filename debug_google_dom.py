@@ -5,11 +5,13 @@ Run: python debug_google_dom.py
 """
 
 import json
-import re
 from pathlib import Path
 
 from playwright.sync_api import sync_playwright
 
+# Same compiled patterns as the scraper, so findings match what production would extract
+from company_contact_scraper import CONSENT_BUTTON_PATTERNS, EMAIL_PATTERN, SERP_RESULTS_SELECTOR
+
 OUTPUT_DIR = Path(__file__).parent / "debug_output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
@@ -27,12 +29,12 @@ def main():
         page = context.new_page()
 
         try:
-            page.goto("https://www.google.com", wait_until="networkidle", timeout=15000)
+            page.goto("https://www.google.com", wait_until="domcontentloaded", timeout=15000)
 
             # Consent
-            for btn_text in ["Accept all", "I agree", "Accept"]:
+            for pattern in CONSENT_BUTTON_PATTERNS:
                 try:
-                    btn = page.get_by_role("button", name=re.compile(btn_text, re.I))
+                    btn = page.get_by_role("button", name=pattern)
                     if btn.count() > 0:
                         btn.first.click(timeout=3000)
                         page.wait_for_timeout(2000)
@@ -44,8 +46,12 @@ def main():
             search = page.locator('textarea[name="q"], input[name="q"]').first
             search.fill(query)
             search.press("Enter")
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(4000)
+            # networkidle rarely fires on Google (long-polling trackers); wait for the results instead
+            page.wait_for_load_state("domcontentloaded")
+            try:
+                page.wait_for_selector(SERP_RESULTS_SELECTOR, timeout=5000)
+            except Exception:
+                print("No organic results appeared (CAPTCHA?) - saving the page anyway")
 
             # Save full HTML
             html = page.content()
@@ -68,12 +74,12 @@ def main():
             findings["http_links"] = hrefs[:20]
 
             # Text containing email
+            emails = set(EMAIL_PATTERN.findall(html))
             if "sales@42gears.com" in html or "@42gears" in html:
-                findings["emails_in_html"] = list(set(re.findall(r"[a-zA-Z0-9._%+-]+@42gears\.com", html)))
+                findings["emails_in_html"] = [e for e in emails if e.lower().endswith("@42gears.com")]
             else:
                 findings["emails_in_html"] = "NOT FOUND - checking regex on full content"
-                emails = re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", html)
-                findings["any_emails_in_html"] = list(set(emails))[:10]
+                findings["any_emails_in_html"] = list(emails)[:10]
 
             # AI Overview
             try:
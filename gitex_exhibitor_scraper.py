@@ -4,161 +4,368 @@ GITEX Global 2025 Exhibitor Scraper
 Fetches exhibitor details (name, country, sector) from https://exhibitors.gitex.com/gitex-global-2025/Exhibitor
 """
 
+import asyncio
 import csv
+import os
 import re
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Any, Mapping
+from urllib.parse import urlencode
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 
 BASE_URL = "https://exhibitors.gitex.com"
 EVENT_SLUG = "gitex-global-2025"
 FETCH_URL = f"{BASE_URL}/{EVENT_SLUG}/Exhibitor/fetchExhibitors"
-PAGE_LIMIT = 100  # Records per API request
-
-
-def fetch_exhibitors_page(start: int) -> str:
-    """Fetch a page of exhibitors from the API."""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Accept": "*/*",
-        "Origin": BASE_URL,
-        "Referer": f"{BASE_URL}/{EVENT_SLUG}/Exhibitor",
-    }
-    data = {
-        "limit": PAGE_LIMIT,
-        "start": start,
-        "keyword_search": "",
-        "cuntryId": "",
-        "event_prod_cat_id": "",
-        "exb_listed_as": "",
-        "InitialKey": "",
-        "selected_event_id": "",
-        "start_up_exhibitors": "",
-        "pav_country_id": "",
-        "type": "",
-        "vacancies": "",
-        "product_search": "",
-        "new_category": "",
-        "new_sub_category": "",
-        "new_sub_sub_category": "",
-        "search_by_venue": "",
-        "event_sector_value": "",
-    }
-    response = requests.post(FETCH_URL, headers=headers, data=data, timeout=30)
+PAGE_LIMIT = 100  # Records per API request (the site's own page size)
+PROBE_PAGE_LIMIT = 1000  # Asked for on the first request; if the server honours more, later pages use that
+FETCH_CONCURRENCY = 4  # Pages requested at once (default for --concurrency)
+FIELDNAMES = ["exhibitor_name", "country", "sector"]
+Exhibitor = tuple[str, str, str]  # one CSV row, in FIELDNAMES order
+
+# Country: the font-weight 600 span in one of the first three <p> of .web. The selector only
+# narrows to spans with a font-weight; the value is checked with a regex, since spacing varies
+COUNTRY_SPAN_SELECTOR = 'span[style*="font-weight"]'
+COUNTRY_STYLE_RE = re.compile(r"font-weight\s*:\s*600")
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "*/*",
+    # Every encoding urllib3 can decode here: gzip/deflate, plus br/zstd when brotli/zstandard are installed
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Origin": BASE_URL,
+    "Referer": f"{BASE_URL}/{EVENT_SLUG}/Exhibitor",
+}
+
+
+def make_session(retries: bool = True) -> requests.Session:
+    """
+    Keep-alive session for the API: one TLS handshake per pooled connection.
+    429/5xx are retried up to 5 times, waiting Retry-After when sent, else 1, 2, 4, 8 s (+ jitter);
+    retries=False is for probes, where an error just means "not supported" and should fail fast.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5, backoff_factor=1, backoff_jitter=1, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=None
+    ) if retries else Retry(total=0, read=False)
+    # One host; enough pooled sockets for --concurrency pages in flight (requests threads share the pool)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retry))
+    session.headers.update(HEADERS)
+    return session
+
+
+SESSION = make_session()
+PROBE_SESSION = make_session(retries=False)
+
+
+class RateLimiter:
+    """
+    Shared pause for all page fetches, driven by the API's own signals (Retry-After,
+    X-RateLimit-Remaining/Reset) rather than a fixed sleep: no waiting while the server is happy.
+    It only sees responses that reach fetch_and_parse: a 429/5xx retried inside urllib3 is paced by
+    Retry's own backoff (and Retry-After) for that request alone, and other requests keep going
+    until one comes back with the signal.
+    """
+
+    def __init__(self) -> None:
+        self.resume_at = 0.0  # time.monotonic() before which no new request is sent
+
+    async def acquire(self) -> None:
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        wait = _seconds(headers.get("Retry-After"))
+        if headers.get("X-RateLimit-Remaining") == "0":
+            wait = max(wait, _seconds(headers.get("X-RateLimit-Reset")) or 1.0)
+        if wait:
+            print(f"  Rate limited by server, pausing {wait:.0f}s")
+            self.resume_at = max(self.resume_at, time.monotonic() + wait)
+
+
+def _seconds(value: str | None) -> float:
+    """Header value as a delay in seconds; large values are read as an epoch timestamp."""
+    try:
+        n = float(value) if value else 0.0
+    except ValueError:
+        return 0.0  # HTTP-date Retry-After; urllib3 already honours those on retried statuses
+    return max(0.0, n - time.time()) if n > 1e9 else n
+
+
+# fetchExhibitors form fields after limit/start (all filters left empty), URL-encoded once; each
+# request only formats its limit/start in front, so requests has no form dict to encode per page
+FORM_FILTERS = {
+    "keyword_search": "",
+    "cuntryId": "",
+    "event_prod_cat_id": "",
+    "exb_listed_as": "",
+    "InitialKey": "",
+    "selected_event_id": "",
+    "start_up_exhibitors": "",
+    "pav_country_id": "",
+    "type": "",
+    "vacancies": "",
+    "product_search": "",
+    "new_category": "",
+    "new_sub_category": "",
+    "new_sub_sub_category": "",
+    "search_by_venue": "",
+    "event_sector_value": "",
+}
+FORM_FILTERS_ENCODED = urlencode(FORM_FILTERS).encode()
+
+
+def fetch_exhibitors_page(
+    start: int, as_json: bool = False, limit: int = PAGE_LIMIT, session: requests.Session = SESSION
+) -> requests.Response:
+    """Fetch a page of exhibitors from the API (use .content: the parser takes UTF-8 bytes directly)."""
+    data = b"limit=%d&start=%d&" % (limit, start) + FORM_FILTERS_ENCODED
+    headers = {"Accept": "application/json"} if as_json else None
+    response = session.post(FETCH_URL, data=data, headers=headers, timeout=30)
     response.raise_for_status()
-    return response.text
+    return response
+
+
+def parse_exhibitor_card(card: LexborNode) -> Exhibitor:
+    """
+    Extract (exhibitor name, country, sectors) from an exhibitor card.
+    A missing element just leaves its field empty, so partial cards still come through.
+    """
+    # Exhibitor name
+    heading = card.css_first("h4.heading")
+    name = heading.text(strip=True) if heading else ""
+
+    # Country - in span with font-weight in the second p of .web
+    country = ""
+    web = card.css_first("div.web")
+    if web is not None:
+        country = next(
+            (
+                span.text(strip=True)
+                for p in web.css("p")[:3]
+                for span in p.css(COUNTRY_SPAN_SELECTOR)
+                if COUNTRY_STYLE_RE.search(span.attributes.get("style") or "")
+            ),
+            "",
+        )
+
+    # Sectors - from ul.sector_block li
+    sector_list = card.css("ul.sector_block li")
+    sectors = [t for li in sector_list if (t := li.text(strip=True))]
+    sector_str = "; ".join(sectors)
+
+    return name, country, sector_str
+
+
+def parse_exhibitors_page(html: bytes) -> tuple[list[Exhibitor], int]:
+    """Exhibitors on one API page, plus the number of cards it held (a short page is the last one)."""
+    # Check for "no more content" message on the raw bytes: the terminal page is never decoded or parsed
+    if not html.strip() or b"No more content available" in html:
+        return [], 0
+    tree = LexborHTMLParser(html)
+    cards = tree.css("div.item.list-group-item")
+    exhibitors = []
+    for card in cards:
+        exhibitor = parse_exhibitor_card(card)
+        if exhibitor[0]:
+            exhibitors.append(exhibitor)
+    return exhibitors, len(cards)
 
 
-def parse_exhibitor_card(card) -> dict | None:
-    """Extract exhibitor name, country, and sectors from an exhibitor card."""
+def _json_records(body: bytes) -> list[dict] | None:
+    """Exhibitor records of a JSON response (a bare list or under data/exhibitors), or None if it isn't one."""
     try:
-        # Exhibitor name
-        heading = card.select_one("h4.heading")
-        name = heading.get_text(strip=True) if heading else ""
-
-        # Country - in span with font-weight in the second p of .web
-        web_div = card.select_one("div.web")
-        country = ""
-        if web_div:
-            paragraphs = web_div.find_all("p", limit=3)
-            for p in paragraphs:
-                span = p.find("span", style=re.compile(r"font-weight:\s*600"))
-                if span:
-                    country = span.get_text(strip=True)
-                    break
-
-        # Sectors - from ul.sector_block li
-        sector_list = card.select("ul.sector_block li")
-        sectors = [li.get_text(strip=True) for li in sector_list if li.get_text(strip=True)]
-        sector_str = "; ".join(sectors) if sectors else ""
-
-        return {
-            "exhibitor_name": name,
-            "country": country,
-            "sector": sector_str,
-        }
-    except Exception:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
         return None
-
-
-def scrape_all_exhibitors(max_exhibitors: int = 0) -> list[dict]:
-    """Scrape all exhibitors from GITEX Global 2025."""
-    exhibitors = []
+    if isinstance(data, dict):
+        data = data.get("data", data.get("exhibitors"))
+    return data if isinstance(data, list) else None
+
+
+def parse_exhibitor_json(record: dict) -> Exhibitor:
+    """parse_exhibitor_card for one JSON record."""
+    name = record.get("name") or record.get("exhibitor_name") or ""
+    country = record.get("country_name") or record.get("country") or ""
+    sectors = record.get("sectors") or []
+    if isinstance(sectors, str):
+        sectors = sectors.split(",")
+    names = (sec.get("name", "") if isinstance(sec, dict) else str(sec) for sec in sectors)
+    return str(name).strip(), str(country).strip(), "; ".join(n.strip() for n in names if n.strip())
+
+
+def parse_exhibitors_json(body: bytes) -> tuple[list[Exhibitor], int]:
+    """parse_exhibitors_page for a JSON response."""
+    records = _json_records(body) or []
+    exhibitors = [ex for ex in map(parse_exhibitor_json, records) if ex[0]]
+    return exhibitors, len(records)
+
+
+def probe_json_format() -> bool:
+    """
+    True if fetchExhibitors answers Accept: application/json with usable JSON records; the whole
+    HTML parse is then skipped. One single-record request, only with --try-json, never retried.
+    """
+    try:
+        response = fetch_exhibitors_page(0, as_json=True, limit=1, session=PROBE_SESSION)
+    except requests.RequestException:
+        return False
+    if not response.headers.get("Content-Type", "").startswith("application/json"):
+        return False
+    records = _json_records(response.content)
+    return bool(records) and isinstance(records[0], dict) and bool(parse_exhibitor_json(records[0])[0])
+
+
+async def fetch_and_parse(
+    pool: ProcessPoolExecutor,
+    limiter: RateLimiter,
+    start: int,
+    as_json: bool = False,
+    limit: int = PAGE_LIMIT,
+    session: requests.Session = SESSION,
+) -> tuple[list[Exhibitor], int]:
+    """One API page: fetched in a thread (requests is blocking), parsed in a worker process."""
+    await limiter.acquire()
+    response = await asyncio.to_thread(fetch_exhibitors_page, start, as_json, limit, session)
+    limiter.update(response.headers)
+    if as_json:
+        return parse_exhibitors_json(response.content)  # no tree to build; not worth a process hop
+    return await asyncio.get_running_loop().run_in_executor(pool, parse_exhibitors_page, response.content)
+
+
+async def scrape_all_exhibitors(
+    writer: Any, max_exhibitors: int = 0, concurrency: int = FETCH_CONCURRENCY, try_json: bool = False
+) -> int:
+    """
+    Scrape all exhibitors from GITEX Global 2025 into writer (a csv.writer); returns how many were written.
+    Rows are written page by page, so memory holds a few pages, not the whole event.
+    A few consecutive pages are kept in flight (the total is unknown up front) and consumed in order
+    until a short or empty page. Each page is parsed in a worker process as soon as it arrives,
+    so parsing overlaps the other fetches.
+    A single oversized request (PROBE_PAGE_LIMIT records) goes first; only if it returns more than
+    PAGE_LIMIT cards is that size used for later pages, otherwise paging starts over at PAGE_LIMIT.
+    try_json first asks whether the API can answer in JSON (see probe_json_format).
+    """
+    count = 0
     start = 0
+    concurrency = max(1, concurrency)
+    limiter = RateLimiter()
+    as_json = try_json and await asyncio.to_thread(probe_json_format)
+    if as_json:
+        print("API returns JSON; skipping HTML parsing")
+
+    def emit(page_exhibitors: list[Exhibitor], n_cards: int) -> None:
+        nonlocal count
+        if max_exhibitors:
+            page_exhibitors = page_exhibitors[: max_exhibitors - count]
+        writer.writerows(page_exhibitors)
+        count += len(page_exhibitors)
+        print(f"  Found {n_cards} exhibitors (total: {count})")
+
+    page_limit = PAGE_LIMIT
+    check_end = False  # first request alone: tells "more pages" from "that was everything"
+
+    with ProcessPoolExecutor(max_workers=min(concurrency, os.cpu_count() or 1)) as pool:
+        probe_limit = min(PROBE_PAGE_LIMIT, max_exhibitors) if max_exhibitors else PROBE_PAGE_LIMIT
+        if probe_limit > PAGE_LIMIT:
+            print(f"Fetching exhibitors 1 to {probe_limit}...")
+            try:
+                page_exhibitors, n_cards = await fetch_and_parse(
+                    pool, limiter, 0, as_json, probe_limit, PROBE_SESSION
+                )
+            except requests.RequestException as e:
+                print(f"  Large page request failed ({e}); using {PAGE_LIMIT} per request")
+                n_cards = 0
+            if n_cards > PAGE_LIMIT:
+                emit(page_exhibitors, n_cards)
+                page_limit = start = n_cards
+                if n_cards < probe_limit:
+                    # The server's cap, or simply the whole event
+                    check_end = True
+                else:
+                    print(f"  Server accepts {n_cards} records per request")
+            else:
+                # Empty, error page or capped at PAGE_LIMIT: discard and page normally from 0
+                print(f"  Server returned {n_cards} records; using {PAGE_LIMIT} per request")
+
+        # Keep about `concurrency` normal pages' worth of records in flight, consumed strictly in
+        # order; a short page cancels everything not yet sent, so at most width - 1 requests overshoot
+        width = max(1, concurrency * PAGE_LIMIT // page_limit)
+        in_flight: deque[asyncio.Task[tuple[list[Exhibitor], int]]] = deque()
+
+        def top_up(n: int) -> None:
+            nonlocal start
+            while len(in_flight) < n and not (max_exhibitors and start >= max_exhibitors):
+                print(f"Fetching exhibitors {start + 1} to {start + page_limit}...")
+                in_flight.append(asyncio.create_task(fetch_and_parse(pool, limiter, start, as_json, page_limit)))
+                start += page_limit
+
+        try:
+            top_up(1 if check_end else width)
+            while in_flight:
+                page_exhibitors, n_cards = await in_flight.popleft()
+                if n_cards:
+                    emit(page_exhibitors, n_cards)
+                if n_cards < page_limit:
+                    break
+                top_up(width)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
-    while True:
-        if max_exhibitors and len(exhibitors) >= max_exhibitors:
-            break
-        print(f"Fetching exhibitors {start + 1} to {start + PAGE_LIMIT}...")
-
-        html = fetch_exhibitors_page(start)
-
-        # Check for "no more content" message
-        if not html.strip() or "No more content available" in html:
-            break
-
-        soup = BeautifulSoup(html, "html.parser")
-        cards = soup.select("div.item.list-group-item")
-
-        if not cards:
-            break
-
-        for card in cards:
-            if max_exhibitors and len(exhibitors) >= max_exhibitors:
-                break
-            exhibitor = parse_exhibitor_card(card)
-            if exhibitor and exhibitor["exhibitor_name"]:
-                exhibitors.append(exhibitor)
-
-        print(f"  Found {len(cards)} exhibitors (total: {len(exhibitors)})")
-
-        if len(cards) < PAGE_LIMIT:
-            break
-
-        start += PAGE_LIMIT
-        time.sleep(0.5)  # Be polite to the server
-
-    return exhibitors
-
-
-def save_to_csv(exhibitors: list[dict], output_path: str = "gitex_exhibitors.csv") -> None:
-    """Save exhibitors to CSV file."""
-    if not exhibitors:
-        print("No exhibitors to save.")
-        return
-
-    fieldnames = ["exhibitor_name", "country", "sector"]
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(exhibitors)
-
-    print(f"\nSaved {len(exhibitors)} exhibitors to {output_path}")
+    return count
 
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Scrape GITEX exhibitors")
     parser.add_argument("--max", type=int, default=0, help="Max exhibitors to fetch (0=all)")
+    parser.add_argument("--concurrency", type=int, default=FETCH_CONCURRENCY, help="API pages fetched in parallel")
+    parser.add_argument("--try-json", action="store_true", help="Ask the API for JSON first; HTML if unsupported")
     args = parser.parse_args()
 
     print("GITEX Global 2025 Exhibitor Scraper")
     print("=" * 50)
 
-    exhibitors = scrape_all_exhibitors(max_exhibitors=args.max)
-
     output_file = Path(__file__).parent / "gitex_exhibitors.csv"
-    save_to_csv(exhibitors, str(output_file))
+    # Rows are streamed into a temp file next to the output; it only replaces the previous CSV once
+    # the run finished with rows, so a failed or empty run leaves that file untouched
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    try:
+        with open(tmp_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDNAMES)
+            count = asyncio.run(scrape_all_exhibitors(
+                writer, max_exhibitors=args.max, concurrency=args.concurrency, try_json=args.try_json
+            ))
+        if count:
+            os.replace(tmp_file, output_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+    if not count:
+        print("No exhibitors to save.")
+        return
+    print(f"\nSaved {count} exhibitors to {output_file}")
 
     # Preview first 5
-    if exhibitors:
-        print("\nFirst 5 exhibitors:")
-        for i, ex in enumerate(exhibitors[:5], 1):
-            print(f"  {i}. {ex['exhibitor_name']} | {ex['country']} | {ex['sector'][:50]}...")
+    print("\nFirst 5 exhibitors:")
+    with open(output_file, newline="", encoding="utf-8") as f:
+        for i, (name, country, sector) in enumerate(islice(csv.reader(f), 1, 6), 1):
+            print(f"  {i}. {name} | {country} | {sector[:50]}...")
 
 
 if __name__ == "__main__":